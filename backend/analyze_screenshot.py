@@ -12,14 +12,12 @@ import sys
 import logging
 from pathlib import Path
 
+import numpy as np
+
 # Import our table processing modules
 from table_layout import load_room_config, validate_coordinates
 from table_capture_static import load_table_image, get_image_info
-from table_region_cutter import (
-    cut_hero_cards, cut_board_cards, 
-    cut_pot_region, cut_hero_stack_region, 
-    save_regions
-)
+from table_region_cutter import cut_all_regions, save_regions
 
 # Configure logging
 logging.basicConfig(
@@ -86,28 +84,23 @@ def analyze_screenshot(config_path: str, screenshot_path: str, output_dir: str =
         print(f"✅ Table image loaded: {table_image.width}x{table_image.height}")
         print()
         
-        # 5. Extract all regions
+        # 5. Extract all regions (one pass, NumPy views of the table image)
         print("🃏 Extracting card and region areas...")
+        regions = cut_all_regions(np.asarray(table_image), room_config)
         
-        # Hero cards
-        print("   Cutting hero cards...")
-        hero_cards = cut_hero_cards(table_image, room_config)
+        hero_cards = regions['hero_cards']
         print(f"   ✅ Extracted {len(hero_cards)} hero cards")
         
-        # Board cards  
-        print("   Cutting board cards...")
-        board_cards = cut_board_cards(table_image, room_config)
+        board_cards = regions['board_cards']
         print(f"   ✅ Extracted {len(board_cards)} board cards")
         
-        # Pot region
-        print("   Cutting pot region...")
-        pot_image = cut_pot_region(table_image, room_config)
-        print(f"   ✅ Extracted pot region: {pot_image.width}x{pot_image.height}")
+        pot_image = regions['pot_region']
+        pot_h, pot_w = pot_image.shape[:2]
+        print(f"   ✅ Extracted pot region: {pot_w}x{pot_h}")
         
-        # Hero stack region
-        print("   Cutting hero stack region...")
-        stack_image = cut_hero_stack_region(table_image, room_config)
-        print(f"   ✅ Extracted hero stack region: {stack_image.width}x{stack_image.height}")
+        stack_image = regions['hero_stack_region']
+        stack_h, stack_w = stack_image.shape[:2]
+        print(f"   ✅ Extracted hero stack region: {stack_w}x{stack_h}")
         print()
         
         # 6. Save all regions
@@ -124,8 +117,8 @@ def analyze_screenshot(config_path: str, screenshot_path: str, output_dir: str =
         print(f"✅ Table region cropped: {table_image.width}x{table_image.height}")
         print(f"✅ Hero cards extracted: {len(hero_cards)}")
         print(f"✅ Board cards extracted: {len(board_cards)}")
-        print(f"✅ Pot region extracted: {pot_image.width}x{pot_image.height}")
-        print(f"✅ Stack region extracted: {stack_image.width}x{stack_image.height}")
+        print(f"✅ Pot region extracted: {pot_w}x{pot_h}")
+        print(f"✅ Stack region extracted: {stack_w}x{stack_h}")
         print(f"✅ All regions saved to: {Path(output_dir).absolute()}")
         
         if warnings:
@@ -22,6 +22,10 @@ from pathlib import Path
 
 API_URL = "https://table-analyzer.preview.emergentagent.com/api"
 
+# Sessione HTTP condivisa: le chiamate ripetute (polling, più scenari)
+# riusano le connessioni keep-alive invece di rifare TCP+TLS ogni volta
+_SESSION = requests.Session()
+
 
 def get_recognized_cards() -> Dict[str, Any]:
     """
@@ -32,7 +36,7 @@ def get_recognized_cards() -> Dict[str, Any]:
         dict con 'status', 'hero', 'board', ecc.
     """
     try:
-        response = requests.get(f"{API_URL}/table/1/cards", timeout=5)
+        response = _SESSION.get(f"{API_URL}/table/1/cards", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -123,7 +127,7 @@ def analyze_table_with_ai(table_state: Dict[str, Any]) -> Optional[Dict[str, Any
         None se errore
     """
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{API_URL}/poker/live/analyze",
             json=table_state,
             timeout=15
@@ -39,30 +39,24 @@ def extract_cards_from_slots(screenshot: Image.Image,
     slot_width = w // num_slots
     cards = []
     
+    # Crop slot con margini (80% centrale per evitare bordi)
+    margin_x = int(slot_width * 0.1)
+    margin_y = int(h * 0.1)
+    
+    # Zona convertita in grayscale una sola volta: gli slot sono viste numpy
+    zone_gray = np.asarray(screenshot.crop((x, y, x + w, y + h)).convert('L'))
+    
     for i in range(num_slots):
-        # Coordinate slot
-        slot_x = x + (i * slot_width)
-        slot_y = y
-        
-        # Crop slot con margini (80% centrale per evitare bordi)
-        margin_x = int(slot_width * 0.1)
-        margin_y = int(h * 0.1)
-        
-        slot_img = screenshot.crop((
-            slot_x + margin_x,
-            slot_y + margin_y,
-            slot_x + slot_width - margin_x,
-            slot_y + h - margin_y
-        ))
+        # Coordinate slot (relative alla zona)
+        left = i * slot_width + margin_x
+        right = (i + 1) * slot_width - margin_x
         
         # Check se c'è carta (white pixels)
-        arr = np.array(slot_img.convert('L'), dtype=np.float32)
-        white_pixels = np.sum(arr > 200)
-        total_pixels = arr.size
-        white_ratio = white_pixels / total_pixels
+        slot_gray = zone_gray[margin_y:h - margin_y, left:right]
+        white_ratio = np.count_nonzero(slot_gray > 200) / slot_gray.size if slot_gray.size else float('nan')
         
         if white_ratio > white_threshold:
-            cards.append(slot_img)
+            cards.append(screenshot.crop((x + left, y + margin_y, x + right, y + h - margin_y)))
             logger.debug(f"Slot {i+1}: CARTA trovata (white={white_ratio:.2f})")
         else:
             cards.append(None)
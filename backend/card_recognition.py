@@ -83,6 +83,58 @@ def normalize_card_for_recognition(card_image: Image.Image) -> np.ndarray:
         return np.zeros((CARD_TEMPLATE_HEIGHT, CARD_TEMPLATE_WIDTH), dtype=np.float32)
 
 
+def stack_card_templates(templates: Dict[str, np.ndarray]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Stack card templates into one matrix for batched MSE matching.
+    
+    Templates whose shape differs from the standard card size are skipped
+    (they could never match: their MSE is infinite).
+    
+    Args:
+        templates: Dictionary of card templates (code -> numpy array)
+        
+    Returns:
+        Tuple of (card codes, (T, H*W) float64 matrix, squared row norms)
+    """
+    shape = (CARD_TEMPLATE_HEIGHT, CARD_TEMPLATE_WIDTH)
+    codes = [code for code, template in templates.items() if template.shape == shape]
+    if not codes:
+        return [], np.empty((0, shape[0] * shape[1])), np.empty(0)
+    
+    matrix = np.stack([templates[code].ravel() for code in codes]).astype(np.float64)
+    return codes, matrix, np.einsum('ij,ij->i', matrix, matrix)
+
+
+def _is_empty_position(card_image: Image.Image) -> bool:
+    """Check if a card position is empty (very dark with low variance)."""
+    card_array_check = np.array(card_image.convert('L'), dtype=np.float32)
+    mean_brightness = card_array_check.mean()
+    brightness_std = card_array_check.std()
+    
+    if mean_brightness < 55 and brightness_std < 15:
+        logger.debug(f"Empty card position detected (dark): brightness={mean_brightness:.1f}, std={brightness_std:.1f}")
+        return True
+    return False
+
+
+def _classify_match(best_card: Optional[str], best_mse: float,
+                    mse_threshold: float) -> Tuple[Optional[str], float]:
+    """Turn the best template match into (card_code or None, confidence)."""
+    # Calculate confidence score (1 - normalized MSE)
+    # Normalize MSE to 0-1 range (assuming max MSE is around 1.0 for completely different images)
+    max_possible_mse = 1.0
+    normalized_mse = min(best_mse / max_possible_mse, 1.0)
+    confidence = 1.0 - normalized_mse
+    
+    # Check if match is good enough
+    if best_mse <= mse_threshold and confidence >= MIN_CONFIDENCE_SCORE:
+        logger.debug(f"Recognized card: {best_card} (MSE: {best_mse:.4f}, Confidence: {confidence:.3f})")
+        return best_card, confidence
+    
+    logger.debug(f"No confident match found (Best: {best_card}, MSE: {best_mse:.4f}, Confidence: {confidence:.3f})")
+    return None, confidence
+
+
 def recognize_card(card_image: Image.Image, 
                   templates: Dict[str, np.ndarray],
                   mse_threshold: float = MSE_THRESHOLD) -> Tuple[Optional[str], float]:
@@ -97,81 +149,71 @@ def recognize_card(card_image: Image.Image,
     Returns:
         Tuple of (card_code or None, confidence_score)
     """
-    if not templates:
-        logger.warning("No templates provided for card recognition")
-        return None, 0.0
-    
-    try:
-        # Check if card position is empty (mostly uniform)
-        card_array_check = np.array(card_image.convert('L'), dtype=np.float32)
-        mean_brightness = card_array_check.mean()
-        brightness_std = card_array_check.std()
-        
-        # If very dark with low variance, it's likely an empty position
-        if mean_brightness < 55 and brightness_std < 15:
-            logger.debug(f"Empty card position detected (dark): brightness={mean_brightness:.1f}, std={brightness_std:.1f}")
-            return None, 0.0
-        
-        # Normalize the input card
-        card_array = normalize_card_for_recognition(card_image)
-        
-        best_card = None
-        best_mse = float('inf')
-        
-        # Compare with all templates
-        for card_code, template in templates.items():
-            mse = calculate_mse(card_array, template)
-            
-            if mse < best_mse:
-                best_mse = mse
-                best_card = card_code
-        
-        # Calculate confidence score (1 - normalized MSE)
-        # Normalize MSE to 0-1 range (assuming max MSE is around 1.0 for completely different images)
-        max_possible_mse = 1.0
-        normalized_mse = min(best_mse / max_possible_mse, 1.0)
-        confidence = 1.0 - normalized_mse
-        
-        # Check if match is good enough
-        if best_mse <= mse_threshold and confidence >= MIN_CONFIDENCE_SCORE:
-            logger.debug(f"Recognized card: {best_card} (MSE: {best_mse:.4f}, Confidence: {confidence:.3f})")
-            return best_card, confidence
-        else:
-            logger.debug(f"No confident match found (Best: {best_card}, MSE: {best_mse:.4f}, Confidence: {confidence:.3f})")
-            return None, confidence
-            
-    except Exception as e:
-        logger.error(f"Error recognizing card: {e}")
-        return None, 0.0
+    return recognize_cards([card_image], templates, mse_threshold=mse_threshold)[0]
 
 
 def recognize_cards(card_images: List[Image.Image], 
-                   templates: Dict[str, np.ndarray]) -> List[Tuple[Optional[str], float]]:
+                   templates: Dict[str, np.ndarray],
+                   template_stack: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None,
+                   mse_threshold: float = MSE_THRESHOLD) -> List[Tuple[Optional[str], float]]:
     """
     Recognize multiple cards from a list of images.
     
+    All cards are matched against all templates at once: with
+    MSE(a, t) = (|a|² + |t|² - 2·a·t) / n the whole cards x templates
+    score table is a single matrix product instead of a Python loop
+    over 52 templates per card.
+    
     Args:
         card_images: List of PIL Images to recognize
         templates: Dictionary of card templates
+        template_stack: Precomputed stack_card_templates(templates) (optional,
+            lets callers reuse it across screenshots)
+        mse_threshold: Maximum MSE to accept a match
         
     Returns:
         List of tuples (card_code or None, confidence_score)
     """
-    results = []
+    if not templates:
+        logger.warning("No templates provided for card recognition")
+        return [(None, 0.0)] * len(card_images)
+    
+    if template_stack is None:
+        template_stack = stack_card_templates(templates)
+    codes, matrix, template_norms = template_stack
     
+    results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(card_images)
+    
+    # Normalize the non-empty cards into one query matrix
+    slots, rows = [], []
     for i, card_image in enumerate(card_images):
         try:
-            card_code, confidence = recognize_card(card_image, templates)
-            results.append((card_code, confidence))
-            
-            if card_code:
-                logger.debug(f"Card {i+1}: {card_code} (confidence: {confidence:.3f})")
-            else:
-                logger.debug(f"Card {i+1}: unrecognized (confidence: {confidence:.3f})")
-                
+            if _is_empty_position(card_image):
+                continue
+            rows.append(normalize_card_for_recognition(card_image).ravel())
+            slots.append(i)
         except Exception as e:
             logger.error(f"Error recognizing card {i+1}: {e}")
-            results.append((None, 0.0))
+    
+    if slots:
+        if codes:
+            queries = np.stack(rows).astype(np.float64)
+            mse = (np.einsum('ij,ij->i', queries, queries)[:, None]
+                   + template_norms[None, :]
+                   - 2.0 * (queries @ matrix.T)) / queries.shape[1]
+            best = mse.argmin(axis=1)
+            for slot, row, j in zip(slots, mse, best):
+                # max(0): the expansion can dip just below zero on exact matches
+                results[slot] = _classify_match(codes[j], max(float(row[j]), 0.0), mse_threshold)
+        else:
+            for slot in slots:
+                results[slot] = _classify_match(None, float('inf'), mse_threshold)
+    
+    for i, (card_code, confidence) in enumerate(results):
+        if card_code:
+            logger.debug(f"Card {i+1}: {card_code} (confidence: {confidence:.3f})")
+        else:
+            logger.debug(f"Card {i+1}: unrecognized (confidence: {confidence:.3f})")
     
     return results
 
@@ -21,9 +21,10 @@ Pipeline:
 
 import os
 import glob
+import hashlib
 import cv2
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from PIL import Image
 
 TEMPLATES_DIR = "card_templates/pokerstars/full"
@@ -52,10 +53,14 @@ class FullCardRecognizer:
         self.th_strong = threshold_strong
         self.th_soft = threshold_soft
         
+        # Cache per slot: slot_key → (digest crop, risultato) dell'ultimo frame
+        self._slot_cache: Dict[str, Tuple[bytes, Tuple[Optional[str], float, str]]] = {}
+        
         if self.templates:
             # Prendi dimensione dai template
             first_tmpl = next(iter(self.templates.values()))
             self.template_size = (first_tmpl.shape[1], first_tmpl.shape[0])  # (W, H)
+            self._build_template_stack()
             print(f"✅ FullCardRecognizer initialized")
             print(f"   Templates: {len(self.templates)}/52")
             print(f"   Size: {self.template_size[0]}×{self.template_size[1]}px")
@@ -83,6 +88,34 @@ class FullCardRecognizer:
         
         return templates
     
+    def _build_template_stack(self) -> None:
+        """
+        Impila i template in una matrice SoA (N, H*W) float32, già centrata
+        e normalizzata riga per riga.
+        
+        Crop normalizzato e template hanno la stessa dimensione, quindi
+        TM_CCOEFF_NORMED si riduce al prodotto scalare tra i due vettori
+        centrati e normalizzati: un'unica matmul valuta tutti i 52 template.
+        """
+        self.template_codes = list(self.templates.keys())
+        stack = np.stack([self.templates[code] for code in self.template_codes])
+        self.template_stack = _center_and_normalize(
+            stack.reshape(len(self.template_codes), -1)
+        )
+        self._query_buffer = np.empty((0, self.template_stack.shape[1]), dtype=np.float32)
+    
+    def _query_rows(self, count: int) -> np.ndarray:
+        """
+        View (count, H*W) float32 sul buffer query riusato tra i frame.
+        
+        Il buffer cresce solo se servono più righe del frame più grande visto
+        finora: a regime nessuna allocazione per frame. Non rientrante: un
+        recognizer per thread.
+        """
+        if self._query_buffer.shape[0] < count:
+            self._query_buffer = np.empty((count, self.template_stack.shape[1]), dtype=np.float32)
+        return self._query_buffer[:count]
+    
     def normalize_card_crop(self, card_crop: np.ndarray) -> np.ndarray:
         """
         Normalizza un crop di carta per matching.
@@ -133,6 +166,99 @@ class FullCardRecognizer:
         # Se molto bassa → colore uniforme (tavolo, no carta)
         return std < 15.0
     
+    def _classify(self, code: str, score: float) -> Tuple[Optional[str], float, str]:
+        """Applica la doppia soglia ORDINE CAPO al best match."""
+        if score >= self.th_strong:
+            return code, score, "strong"
+        if score >= self.th_soft:
+            return code, score, "weak"
+        return None, score, "none"
+    
+    def recognize_batch(
+        self,
+        card_crops: list,
+        slot_keys: Optional[List[str]] = None
+    ) -> List[Tuple[Optional[str], float, str]]:
+        """
+        Riconosce più carte in un colpo solo.
+        
+        I crop non vuoti vengono normalizzati, impilati in un batch (M, H*W)
+        e confrontati con tutti i template con una sola matmul (M, N).
+        
+        Se vengono passati gli slot_keys, per ogni slot si confronta il digest
+        del crop con quello del frame precedente: se lo slot è invariato
+        si riusa il risultato in cache e il crop esce dal batch.
+        
+        Args:
+            card_crops: Lista di crop di carte (anche di dimensioni diverse)
+            slot_keys: Chiavi stabili degli slot (es: "board0"), opzionali
+            
+        Returns:
+            Lista di triple (card_code, score, conf), una per crop
+        """
+        results = [(None, 0.0, "none")] * len(card_crops)
+        if not self.templates:
+            return results
+        
+        # Gli slot vuoti restano (None, 0.0, "none") senza matching
+        indices = []
+        digests = {}
+        for i, crop in enumerate(card_crops):
+            if self.is_empty_slot(crop):
+                if slot_keys is not None:
+                    self._slot_cache.pop(slot_keys[i], None)
+                continue
+            
+            if slot_keys is not None:
+                digest = crop_digest(crop)
+                cached = self._slot_cache.get(slot_keys[i])
+                if cached is not None and cached[0] == digest:
+                    results[i] = cached[1]
+                    continue
+                digests[i] = digest
+            
+            indices.append(i)
+        
+        if not indices:
+            return results
+        
+        # Query riempite direttamente nel buffer persistente (niente stack/astype per frame)
+        queries = self._query_rows(len(indices))
+        for row, i in zip(queries, indices):
+            row[:] = self.normalize_card_crop(card_crops[i]).ravel()
+        _center_and_normalize_inplace(queries)
+        
+        # scores[m, n] = TM_CCOEFF_NORMED(crop m, template n), valori [-1, 1]
+        scores = queries @ self.template_stack.T
+        best = scores.argmax(axis=1)
+        
+        for i, row, j in zip(indices, scores, best):
+            results[i] = self._classify(self.template_codes[j], float(row[j]))
+            if i in digests:
+                self._slot_cache[slot_keys[i]] = (digests[i], results[i])
+        
+        return results
+    
+    def recognize_regions(
+        self,
+        screen_gray: np.ndarray,
+        rects: List[Tuple[int, int, int, int]],
+        slot_keys: Optional[List[str]] = None
+    ) -> List[Tuple[Optional[str], float, str]]:
+        """
+        Crop + riconoscimento in un passo: i crop sono view dello screenshot.
+        
+        Args:
+            screen_gray: Screenshot del tavolo (grayscale)
+            rects: Box (x, y, w, h) delle carte, in pixel dello screenshot
+            slot_keys: Chiavi stabili degli slot (vedi recognize_batch)
+            
+        Returns:
+            Lista di triple (card_code, score, conf), una per box
+        """
+        crops = [screen_gray[y:y + h, x:x + w] for (x, y, w, h) in rects]
+        return self.recognize_batch(crops, slot_keys)
+    
     def recognize_card(
         self, 
         card_crop: np.ndarray
@@ -151,39 +277,7 @@ class FullCardRecognizer:
         Returns:
             (card_code, score, conf) es: ("Ah", 0.92, "strong")
         """
-        if not self.templates:
-            return None, 0.0, "none"
-        
-        # Check se slot vuoto
-        if self.is_empty_slot(card_crop):
-            return None, 0.0, "none"
-        
-        # Normalize crop
-        card_norm = self.normalize_card_crop(card_crop)
-        
-        # Match con tutti i 52 template
-        best_code = None
-        best_score = -1.0
-        
-        for code, tmpl in self.templates.items():
-            # matchTemplate con TM_CCOEFF_NORMED
-            # Ritorna valori [-1, 1], 1 = match perfetto
-            res = cv2.matchTemplate(card_norm, tmpl, cv2.TM_CCOEFF_NORMED)
-            score = float(res.max())
-            
-            if score > best_score:
-                best_score = score
-                best_code = code
-        
-        # Determina confidenza ORDINE CAPO
-        if best_score >= self.th_strong:
-            conf = "strong"
-        elif best_score >= self.th_soft:
-            conf = "weak"
-        else:
-            return None, best_score, "none"
-        
-        return best_code, best_score, conf
+        return self.recognize_batch([card_crop])[0]
     
     def recognize_multiple(self, card_crops: list) -> list:
         """
@@ -195,21 +289,48 @@ class FullCardRecognizer:
         Returns:
             Lista di dict {"code": str, "score": float, "conf": str}
         """
-        results = []
-        for crop in card_crops:
-            code, score, conf = self.recognize_card(crop)
-            results.append({
-                "code": code,
-                "score": score,
-                "conf": conf
-            })
-        return results
+        return [
+            {"code": code, "score": score, "conf": conf}
+            for code, score, conf in self.recognize_batch(card_crops)
+        ]
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def crop_digest(card_crop: np.ndarray) -> bytes:
+    """
+    Digest blake2b dei pixel del crop.
+    
+    Uno slot fermo nella cattura schermo è identico byte per byte tra un
+    frame e l'altro: basta un hash esatto per saltare il template matching.
+    Un hash percettivo (dHash) non va bene qui: carte diverse differiscono
+    solo per angoli e semi e finirebbero nello stesso bucket.
+    """
+    if isinstance(card_crop, Image.Image):
+        card_crop = np.array(card_crop)
+    
+    return hashlib.blake2b(np.ascontiguousarray(card_crop).tobytes(), digest_size=16).digest()
+
+
+def _center_and_normalize(rows: np.ndarray) -> np.ndarray:
+    """
+    Sottrae la media e divide per la norma L2 ogni riga (float32).
+    
+    Prodotto scalare tra due righe così trattate = TM_CCOEFF_NORMED.
+    """
+    return _center_and_normalize_inplace(rows.astype(np.float32))
+
+
+def _center_and_normalize_inplace(rows: np.ndarray) -> np.ndarray:
+    """Come _center_and_normalize, ma sul buffer float32 passato (nessuna copia)."""
+    rows -= rows.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    rows /= np.maximum(norms, 1e-6)
+    return rows
+
+
 def extract_card_from_table(
     screen: np.ndarray,
     x: int, y: int, w: int, h: int
@@ -267,8 +388,8 @@ if __name__ == "__main__":
         if not os.path.exists(test_file):
             continue
         
-        # Load image
-        img = cv2.imread(test_file)
+        # Load image (decodifica diretta a 1 canale, il matching lavora in gray)
+        img = cv2.imread(test_file, cv2.IMREAD_GRAYSCALE)
         
         # Recognize con nuova API (tripla)
         code, score, conf = recognizer.recognize_card(img)
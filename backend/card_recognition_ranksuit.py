@@ -173,6 +173,81 @@ def normalize_region(region_image: Image.Image) -> np.ndarray:
     return arr
 
 
+def _stack_templates(templates: Dict[str, np.ndarray],
+                     shape: Tuple[int, int]) -> Tuple[List[str], np.ndarray]:
+    """
+    Impila i template di una stessa dimensione in un array (T, H, W).
+    
+    I template di forma diversa vengono esclusi (MSE infinito, non
+    potrebbero mai vincere).
+    """
+    keys = [key for key, template in templates.items() if template.shape == shape]
+    if not keys:
+        return keys, np.empty((0,) + shape, dtype=np.float32)
+    return keys, np.stack([templates[key] for key in keys])
+
+
+def stack_ranksuit_templates(
+    rank_templates: Dict[str, np.ndarray],
+    suit_templates: Dict[str, np.ndarray]
+) -> Tuple[List[str], np.ndarray, List[str], np.ndarray]:
+    """
+    Impila una volta sola i template rank (T, 35, 35) e suit (T, 53, 35).
+    
+    Da calcolare al caricamento dei template e passare a
+    recognize_cards_ranksuit(template_stacks=...) quando gli stessi
+    template servono per molte chiamate.
+    
+    Returns:
+        Tuple (rank_keys, rank_stack, suit_keys, suit_stack)
+    """
+    rank_keys, rank_stack = _stack_templates(rank_templates, (RANK_HEIGHT, RANK_WIDTH))
+    suit_keys, suit_stack = _stack_templates(suit_templates, (SUIT_HEIGHT, SUIT_WIDTH))
+    return rank_keys, rank_stack, suit_keys, suit_stack
+
+
+def _best_matches(queries: np.ndarray, keys: List[str],
+                  stack: np.ndarray) -> List[Tuple[Optional[str], float]]:
+    """
+    MSE di tutte le regioni (N, H, W) contro tutti i template (T, H, W) in
+    una sola operazione vettoriale; ritorna (miglior template, MSE) per regione.
+    """
+    if not keys:
+        return [(None, float('inf'))] * len(queries)
+    mse = ((queries[:, None] - stack[None]) ** 2).mean(axis=(2, 3))
+    best = mse.argmin(axis=1)
+    return [(keys[j], float(row[j])) for row, j in zip(mse, best)]
+
+
+def _decide(best_rank: Optional[str], best_rank_mse: float,
+            best_suit: Optional[str], best_suit_mse: float) -> Tuple[Optional[str], float]:
+    """Applica soglie e confidenza combinata al miglior rank/suit."""
+    # Check thresholds
+    if best_rank_mse > RANK_MSE_THRESHOLD:
+        logger.debug(f"Rank MSE too high: {best_rank_mse:.4f} > {RANK_MSE_THRESHOLD}")
+        return None, 0.0
+    
+    if best_suit_mse > SUIT_MSE_THRESHOLD:
+        logger.debug(f"Suit MSE too high: {best_suit_mse:.4f} > {SUIT_MSE_THRESHOLD}")
+        return None, 0.0
+    
+    # Calculate confidences
+    rank_conf = 1.0 - min(best_rank_mse, 1.0)
+    suit_conf = 1.0 - min(best_suit_mse, 1.0)
+    
+    # Combined confidence
+    combined_conf = 0.5 * rank_conf + 0.5 * suit_conf
+    
+    # Decision
+    if combined_conf >= MIN_COMBINED_CONFIDENCE:
+        card_code = f"{best_rank}{best_suit}"
+        logger.debug(f"Recognized: {card_code} (rank_conf={rank_conf:.3f}, suit_conf={suit_conf:.3f}, combined={combined_conf:.3f})")
+        return card_code, combined_conf
+    else:
+        logger.debug(f"Combined confidence too low: {combined_conf:.3f} < {MIN_COMBINED_CONFIDENCE}")
+        return None, combined_conf
+
+
 def recognize_card_ranksuit(
     card_image: Image.Image,
     rank_templates: Dict[str, np.ndarray],
@@ -193,95 +268,68 @@ def recognize_card_ranksuit(
         - card_code: "Ah", "7d", etc. oppure None se non riconosciuta
         - confidence: valore 0-1
     """
-    if not rank_templates or not suit_templates:
-        logger.warning("Templates not loaded")
-        return None, 0.0
-    
-    try:
-        # STEP 1: NORMALIZE with PIPELINE UNICA (ORDINE CAPO FASE 6.2)
-        # SAME transformation used for template generation
-        from card_normalization import normalize_card_for_template
-        normalized_card = normalize_card_for_template(card_image)
-        
-        # ORDINE CAPO FASE 6.2: NO empty check needed
-        # Geometric detection già garantisce che ci sono carte nelle posizioni estratte
-        
-        # Extract regions from NORMALIZED card
-        rank_region = extract_rank_region(normalized_card)
-        suit_region = extract_suit_region(normalized_card)
-        
-        # Convert to arrays for matching
-        rank_arr = normalize_region(rank_region)
-        suit_arr = normalize_region(suit_region)
-        
-        # Rank matching
-        best_rank = None
-        best_rank_mse = float('inf')
-        
-        for rank_symbol, rank_template in rank_templates.items():
-            mse = calculate_mse(rank_arr, rank_template)
-            
-            if mse < best_rank_mse:
-                best_rank_mse = mse
-                best_rank = rank_symbol
-        
-        # Suit matching
-        best_suit = None
-        best_suit_mse = float('inf')
-        
-        for suit_letter, suit_template in suit_templates.items():
-            mse = calculate_mse(suit_arr, suit_template)
-            
-            if mse < best_suit_mse:
-                best_suit_mse = mse
-                best_suit = suit_letter
-        
-        # Check thresholds
-        if best_rank_mse > RANK_MSE_THRESHOLD:
-            logger.debug(f"Rank MSE too high: {best_rank_mse:.4f} > {RANK_MSE_THRESHOLD}")
-            return None, 0.0
-        
-        if best_suit_mse > SUIT_MSE_THRESHOLD:
-            logger.debug(f"Suit MSE too high: {best_suit_mse:.4f} > {SUIT_MSE_THRESHOLD}")
-            return None, 0.0
-        
-        # Calculate confidences
-        rank_conf = 1.0 - min(best_rank_mse, 1.0)
-        suit_conf = 1.0 - min(best_suit_mse, 1.0)
-        
-        # Combined confidence
-        combined_conf = 0.5 * rank_conf + 0.5 * suit_conf
-        
-        # Decision
-        if combined_conf >= MIN_COMBINED_CONFIDENCE:
-            card_code = f"{best_rank}{best_suit}"
-            logger.debug(f"Recognized: {card_code} (rank_conf={rank_conf:.3f}, suit_conf={suit_conf:.3f}, combined={combined_conf:.3f})")
-            return card_code, combined_conf
-        else:
-            logger.debug(f"Combined confidence too low: {combined_conf:.3f} < {MIN_COMBINED_CONFIDENCE}")
-            return None, combined_conf
-            
-    except Exception as e:
-        logger.error(f"Error recognizing card: {e}")
-        return None, 0.0
+    return recognize_cards_ranksuit([card_image], rank_templates, suit_templates)[0]
 
 
 def recognize_cards_ranksuit(
     card_images: List[Image.Image],
     rank_templates: Dict[str, np.ndarray],
-    suit_templates: Dict[str, np.ndarray]
+    suit_templates: Dict[str, np.ndarray],
+    template_stacks: Optional[Tuple[List[str], np.ndarray, List[str], np.ndarray]] = None
 ) -> List[Tuple[Optional[str], float]]:
     """
     Riconosce multiple carte.
     
+    Le regioni rank/suit di tutte le carte vengono confrontate con tutti i
+    template in un colpo solo (array (N, T) di MSE) invece di un loop Python
+    carta × template.
+    
+    Args:
+        template_stacks: stack_ranksuit_templates() già calcolato (opzionale,
+                         evita di ri-impilare i template ad ogni chiamata)
+    
     Returns:
         Lista di tuple (card_code, confidence)
     """
-    results = []
+    if not rank_templates or not suit_templates:
+        logger.warning("Templates not loaded")
+        return [(None, 0.0)] * len(card_images)
+    
+    from card_normalization import normalize_card_for_template
+    
+    results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(card_images)
+    
+    # STEP 1: NORMALIZE with PIPELINE UNICA (ORDINE CAPO FASE 6.2)
+    # SAME transformation used for template generation
+    # ORDINE CAPO FASE 6.2: NO empty check needed
+    # Geometric detection già garantisce che ci sono carte nelle posizioni estratte
+    slots, normalized_cards = [], []
+    for i, card_image in enumerate(card_images):
+        try:
+            normalized_cards.append(np.asarray(normalize_card_for_template(card_image)))
+            slots.append(i)
+        except Exception as e:
+            logger.error(f"Error recognizing card: {e}")
+    
+    if not slots:
+        return results
+    
+    # Carte normalizzate (L, 89x118) impilate in (N, H, W): le regioni rank/suit
+    # di tutte le carte sono viste sullo stesso array (stesso risultato di
+    # extract_*_region + normalize_region, senza crop PIL per carta)
+    cards = np.stack(normalized_cards)
+    rank_rows = cards[:, RANK_Y:RANK_Y + RANK_HEIGHT, RANK_X:RANK_X + RANK_WIDTH].astype(np.float32) / 255.0
+    suit_rows = cards[:, SUIT_Y:SUIT_Y + SUIT_HEIGHT, SUIT_X:SUIT_X + SUIT_WIDTH].astype(np.float32) / 255.0
+    
+    # Rank + suit matching (batch)
+    if template_stacks is None:
+        template_stacks = stack_ranksuit_templates(rank_templates, suit_templates)
+    rank_keys, rank_stack, suit_keys, suit_stack = template_stacks
+    rank_matches = _best_matches(rank_rows, rank_keys, rank_stack)
+    suit_matches = _best_matches(suit_rows, suit_keys, suit_stack)
     
-    for card_image in card_images:
-        card_code, confidence = recognize_card_ranksuit(card_image, rank_templates, suit_templates)
-        results.append((card_code, confidence))
+    for slot, (best_rank, rank_mse), (best_suit, suit_mse) in zip(slots, rank_matches, suit_matches):
+        results[slot] = _decide(best_rank, rank_mse, best_suit, suit_mse)
     
     return results
 
@@ -7,10 +7,34 @@ per calcolare equity esatta nel Texas Hold'em.
 Molto più preciso della "stima" dell'AI!
 """
 import random
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from deuces import Card, Evaluator
 
 
+# Deck completo in formato deuces, costruito una sola volta all'import
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+SUITS = ['s', 'h', 'd', 'c']
+FULL_DECK = [Card.new(r + s) for r in RANKS for s in SUITS]
+
+# Risultati preflop memorizzati per (mano canonica, avversari, simulazioni):
+# a board vuoto l'equity dipende solo dalle 169 mani canoniche ("AKs", "72o", "TT")
+_PREFLOP_EQUITY: Dict[Tuple[str, int, int], Tuple[float, float, float]] = {}
+
+
+def preflop_key(hero_cards: List[str]) -> str:
+    """
+    Chiave canonica della mano preflop (una delle 169).
+    
+    Es: ["Kd", "As"] → "AKo", ["9h", "8h"] → "98s", ["Tc", "Td"] → "TT"
+    """
+    (r1, s1), (r2, s2) = ((c[0].upper(), c[1].lower()) for c in hero_cards)
+    if RANKS.index(r1) < RANKS.index(r2):
+        r1, r2 = r2, r1
+    if r1 == r2:
+        return r1 + r2
+    return r1 + r2 + ("s" if s1 == s2 else "o")
+
+
 class EquityCalculator:
     """
     Calcolo equity preciso per Texas Hold'em.
@@ -80,9 +104,23 @@ class EquityCalculator:
         except Exception as e:
             raise ValueError(f"Errore parsing carte: {e}")
         
+        # Preflop: una sola simulazione per mano canonica (per processo)
+        preflop = None
+        if not board and hero[0] != hero[1]:
+            preflop = (preflop_key(hero_cards), num_opponents, num_simulations)
+        if preflop in _PREFLOP_EQUITY:
+            return _PREFLOP_EQUITY[preflop]
+        
         # Carte conosciute (rimuovile dal deck)
         known_cards = set(hero + board)
         
+        # Deck residuo: è lo stesso per tutte le simulazioni, lo calcoliamo una volta
+        remaining_deck = [c for c in FULL_DECK if c not in known_cards]
+        
+        # Carte da pescare per ogni simulazione: completamento board + 2 per avversario
+        cards_needed = 5 - len(board)
+        draw_count = min(cards_needed + 2 * num_opponents, len(remaining_deck))
+        
         # Contatori
         wins = 0
         ties = 0
@@ -90,18 +128,11 @@ class EquityCalculator:
         
         # Monte Carlo simulation
         for _ in range(num_simulations):
-            # Crea deck completo manualmente
-            ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-            suits = ['s', 'h', 'd', 'c']
-            full_deck = [Card.new(r + s) for r in ranks for s in suits]
-            
-            # Rimuovi carte conosciute
-            deck = [c for c in full_deck if c not in known_cards]
-            random.shuffle(deck)
+            # Peschiamo solo le carte che servono invece di mescolare tutto il deck
+            deck = random.sample(remaining_deck, draw_count)
             
             # Completa il board (se necessario)
             current_board = board.copy()
-            cards_needed = 5 - len(current_board)
             if cards_needed > 0:
                 drawn_cards = deck[:cards_needed]
                 current_board.extend(drawn_cards)
@@ -139,6 +170,9 @@ class EquityCalculator:
         tie_rate = ties / total
         lose_rate = losses / total
         
+        if preflop is not None:
+            _PREFLOP_EQUITY[preflop] = (win_rate, tie_rate, lose_rate)
+        
         return (win_rate, tie_rate, lose_rate)
     
     def get_equity_percentage(
@@ -176,6 +210,20 @@ class EquityCalculator:
             return 0.5
 
 
+def compute_equity_percentage(
+    hero_cards: List[str],
+    board_cards: List[str],
+    num_opponents: int = 1
+) -> float:
+    """
+    Helper a livello modulo per eseguire il Monte Carlo in un processo worker.
+
+    Le funzioni top-level sono picklabili, quindi possono essere passate
+    direttamente a un ProcessPoolExecutor (anche su Windows con spawn).
+    """
+    return EquityCalculator().get_equity_percentage(hero_cards, board_cards, num_opponents)
+
+
 # Test standalone
 if __name__ == "__main__":
     print("\n" + "=" * 70)
@@ -6,6 +6,7 @@ NUOVA ARCHITETTURA:
 - analyze_table_state(): Il "cervello" che riceve JSON stato tavolo e ritorna decisione completa
 - analyze_hand(): Metodo legacy per la demo (manteniamo per retrocompatibilità)
 """
+import asyncio
 import os
 import json
 from typing import List, Optional, Dict, Any
@@ -338,10 +339,13 @@ Rispondi SOLO con il JSON, niente altro."""
         }
     
     async def analyze_hand_async(self, *args, **kwargs) -> str:
-        """Versione async dell'analisi (per compatibilità futura)."""
-        # Per ora, Groq sync è sufficientemente veloce
-        # In futuro si può implementare con async Groq client
-        return self.analyze_hand(*args, **kwargs)
+        """
+        Versione async dell'analisi.
+        
+        Il client Groq sync gira in un thread: l'event loop resta libero e
+        più analisi possono essere in volo insieme (asyncio.gather).
+        """
+        return await asyncio.to_thread(self.analyze_hand, *args, **kwargs)
 
 
 # Esempio di utilizzo
@@ -9,7 +9,7 @@ import base64
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Optional
 
 # Carica variabili d'ambiente
 from dotenv import load_dotenv
@@ -41,12 +41,14 @@ class PokerVisionAI:
         self.model = "gemini-2.0-flash"
         self.provider = "gemini"
     
-    def _encode_image_base64(self, image_path: str) -> str:
+    def _encode_image_base64(self, image_path: str, image_file: Optional[BinaryIO] = None) -> str:
         from PIL import Image
         import io
         
         try:
-            img = Image.open(image_path)
+            # Se abbiamo già il file dell'upload aperto evitiamo di rileggerlo da disco
+            source = image_file if image_file is not None else image_path
+            img = Image.open(source)
             
             # Resize intelligente
             max_size = 2048
@@ -62,16 +64,28 @@ class PokerVisionAI:
         except Exception as e:
             raise ValueError(f"Impossibile aprire immagine {image_path}: {e}")
     
-    async def analyze_poker_table(self, screenshot_path: str, table_id: int = 1) -> Dict[str, Any]:
-        """Analizza screenshot e ritorna dati strutturati."""
+    async def analyze_poker_table(
+        self,
+        screenshot_path: str,
+        table_id: int = 1,
+        image_file: Optional[BinaryIO] = None,
+    ) -> Dict[str, Any]:
+        """Analizza screenshot e ritorna dati strutturati.
+
+        Se image_file è passato (file binario già aperto, es. l'upload), l'immagine
+        viene decodificata da lì e screenshot_path serve solo come riferimento.
+        """
         
         # Verifica esistenza file
-        if not os.path.exists(screenshot_path):
+        if image_file is None and not os.path.exists(screenshot_path):
             print(f"❌ File non trovato: {screenshot_path}")
             return self._create_fallback_response(table_id)
 
         try:
-            image_base64 = self._encode_image_base64(screenshot_path)
+            # Decode + resize + JPEG encode sono CPU-bound: fuori dall'event loop
+            image_base64 = await asyncio.to_thread(
+                self._encode_image_base64, screenshot_path, image_file
+            )
             
             chat = LlmChat(
                 api_key=self.api_key,
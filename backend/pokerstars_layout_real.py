@@ -23,6 +23,11 @@ from card_recognition_hero_back import HeroBackRecognizer
 BASE_WIDTH = 2048
 BASE_HEIGHT = 1279
 
+# Stile label overlay di debug (costanti, non ricalcolate a ogni carta)
+LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+LABEL_SCALE = 0.6
+LABEL_THICKNESS = 2
+
 
 class PokerStarsLayout2048x1279:
     """Layout REALE per PokerStars screenshot 2048×1279.
@@ -86,7 +91,7 @@ def recognize_table_cards_pokerstars(
     """ORDINE CAPO: Riconosce tutte le 7 carte da screenshot tavolo.
 
     Args:
-        screen_bgr: Screenshot BGR del tavolo (qualsiasi risoluzione)
+        screen_bgr: Screenshot BGR o grayscale del tavolo (qualsiasi risoluzione)
         layout: Layout con coordinate misurate su 2048×1279
         full_recognizer: FullCardRecognizer per hero_front + board
         hero_back_recognizer: HeroBackRecognizer per hero_back
@@ -106,8 +111,8 @@ def recognize_table_cards_pokerstars(
             ]
         }
     """
-    # Convert to grayscale
-    gray = cv2.cvtColor(screen_bgr, cv2.COLOR_BGR2GRAY)
+    # Convert to grayscale (frame già gray, es. cv2.IMREAD_GRAYSCALE: nessuna conversione)
+    gray = screen_bgr if screen_bgr.ndim == 2 else cv2.cvtColor(screen_bgr, cv2.COLOR_BGR2GRAY)
     h, w = gray.shape[:2]
 
     # Fattori di scala rispetto alla risoluzione base
@@ -137,40 +142,23 @@ def recognize_table_cards_pokerstars(
         }
     )
 
-    # --- HERO FRONT (carta davanti, full-card) ---
-    fx, fy, fw, fh = layout.hero_front
-    sfx, sfy, sfw, sfh = _scale_bbox((fx, fy, fw, fh), scale_x, scale_y, w, h)
-    front_crop = crop_gray(sfx, sfy, sfw, sfh)
-    front_code, front_score, front_conf = full_recognizer.recognize_card(front_crop)
-    results["hero"].append(
-        {
-            "code": front_code,
-            "score": front_score,
-            "conf": front_conf,
-            "bbox": (sfx, sfy, sfw, sfh),
-        }
-    )
-
-    # --- BOARD (5 carte full-card) ---
-    for (x, y, w_box, h_box) in layout.board_cards:
-        sx, sy, sw, sh = _scale_bbox((x, y, w_box, h_box), scale_x, scale_y, w, h)
-        b_crop = crop_gray(sx, sy, sw, sh)
-        code, score, conf = full_recognizer.recognize_card(b_crop)
-        results["board"].append(
+    # --- HERO FRONT + BOARD (6 carte full-card, un solo batch) ---
+    # Tutti i crop full-card vengono valutati insieme contro i 52 template;
+    # gli slot invariati dal frame precedente escono dal batch (cache per slot)
+    full_bboxes = [
+        _scale_bbox(bbox, scale_x, scale_y, w, h)
+        for bbox in [layout.hero_front, *layout.board_cards]
+    ]
+    slot_keys = ["hero_front"] + [f"board{i}" for i in range(len(layout.board_cards))]
+    full_matches = full_recognizer.recognize_regions(gray, full_bboxes, slot_keys)
+
+    for i, (bbox, (code, score, conf)) in enumerate(zip(full_bboxes, full_matches)):
+        results["hero" if i == 0 else "board"].append(
             {
                 "code": code,
                 "score": score,
                 "conf": conf,
-                "bbox": (sx, sy, sw, sh),
-            }
-        )
-
-    results["board"].append(
-            {
-                "code": code,
-                "score": score,
-                "conf": conf,
-                "bbox": (sx, sy, sw, sh),
+                "bbox": bbox,
             }
         )
 
@@ -181,6 +169,7 @@ def visualize_recognition(
     screen_bgr,
     results: Dict,
     output_path: str | None = None,
+    scale: float = 0.5,
 ):
     """Visualizza risultati riconoscimento su screenshot.
 
@@ -188,69 +177,35 @@ def visualize_recognition(
         screen_bgr: Screenshot originale
         results: Output di recognize_table_cards()
         output_path: Dove salvare (opzionale)
-    """
-    vis = screen_bgr.copy()
-
-    # Hero cards (verde)
-    for i, card in enumerate(results["hero"]):
-        x, y, w_box, h_box = card["bbox"]
-        code = card["code"] or "???"
-        conf = card["conf"]
-        score = card["score"]
-
-        # Colore box basato su confidenza
-        if conf == "strong":
-            color = (0, 255, 0)  # Verde
-        elif conf == "weak":
-            color = (0, 255, 255)  # Giallo
-        else:
-            color = (0, 0, 255)  # Rosso
-
-        cv2.rectangle(vis, (x, y), (x + w_box, y + h_box), color, 3)
-
-        # Label
-        label = f"H{i+1}: {code} ({score:.2f})"
-        cv2.putText(
-            vis,
-            label,
-            (x, y - 10),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            color,
-            2,
-        )
+        scale: Fattore di scala del preview (1.0 = risoluzione piena)
 
-    # Board cards (cyan)
-    for i, card in enumerate(results["board"]):
-        x, y, w_box, h_box = card["bbox"]
-        code = card["code"] or "???"
-        conf = card["conf"]
-        score = card["score"]
-
-        # Colore box basato su confidenza
-        if conf == "strong":
-            color = (255, 255, 0)  # Cyan
-        elif conf == "weak":
-            color = (0, 255, 255)  # Giallo
-        else:
-            color = (0, 0, 255)  # Rosso
-
-        cv2.rectangle(vis, (x, y), (x + w_box, y + h_box), color, 3)
-
-        # Label
-        label = f"B{i+1}: {code} ({score:.2f})"
-        cv2.putText(
-            vis,
-            label,
-            (x, y - 10),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            color,
-            2,
-        )
+    Di default disegna su un preview a metà risoluzione: evita la copia
+    dell'intero frame e riduce a 1/4 il lavoro di encoding PNG.
+    """
+    if scale == 1.0:
+        vis = screen_bgr.copy()
+    else:
+        vis = cv2.resize(screen_bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    # Hero: verde se strong; board: cyan se strong (giallo weak, rosso none)
+    for section, prefix, strong_color in (
+        ("hero", "H", (0, 255, 0)),
+        ("board", "B", (255, 255, 0)),
+    ):
+        colors = {"strong": strong_color, "weak": (0, 255, 255)}
+        for i, card in enumerate(results[section]):
+            x, y, w_box, h_box = (int(v * scale) for v in card["bbox"])
+            color = colors.get(card["conf"], (0, 0, 255))
+
+            cv2.rectangle(vis, (x, y), (x + w_box, y + h_box), color, 3)
+
+            # Label
+            label = f"{prefix}{i+1}: {card['code'] or '???'} ({card['score']:.2f})"
+            cv2.putText(vis, label, (x, y - 10), LABEL_FONT, LABEL_SCALE, color, LABEL_THICKNESS)
 
     if output_path:
-        cv2.imwrite(output_path, vis)
+        # Overlay di debug: compressione PNG minima (deflate veloce, file solo per l'occhio umano)
+        cv2.imwrite(output_path, vis, [cv2.IMWRITE_PNG_COMPRESSION, 1])
 
     return vis
 
@@ -4,6 +4,7 @@ Invia screenshot direttamente all'endpoint Vision AI.
 """
 import time
 import io
+import hashlib
 import requests
 from PIL import Image
 import mss
@@ -22,6 +23,8 @@ except ImportError:
 class PokerClient:
     def __init__(self):
         self.sct = mss.mss()
+        # Digest dell'ultimo frame analizzato: se il tavolo non cambia non rinviamo
+        self._last_digest = None
         print(f"✅ Client Vision avviato.")
         print(f"🎯 Target: {API_URL}")
 
@@ -66,18 +69,24 @@ class PokerClient:
                 analysis = data.get("analysis", {})
                 action = analysis.get("recommended_action", "???")
                 print(f"✅ {action}")
+                return True
             else:
                 print(f"⚠️ Server: {res.status_code}")
                 
         except Exception as e:
             print(f"❌ Errore invio: {e}")
+        return False
 
     def run(self):
         print("🚀 Loop attivo (Ctrl+C per stop)...")
         while True:
             img = self.capture()
             if img:
-                self.send_to_vision(img)
+                digest = hashlib.blake2b(img.tobytes(), digest_size=16).digest()
+                if digest == self._last_digest:
+                    print("⏸️ Tavolo invariato, skip")
+                elif self.send_to_vision(img):
+                    self._last_digest = digest
             time.sleep(INTERVAL)
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
@@ -7,13 +7,19 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import psutil
 from shared_state import SharedState # Import memoria condivisa
 
 # --- SETUP BASE ---
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-app = FastAPI()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 api_router = APIRouter(prefix="/api")
 
 # Import Vision Analyzer Router (IL CUORE DEL SISTEMA)
@@ -21,25 +27,56 @@ from vision_analyzer_api import vision_router
 api_router.include_router(vision_router)
 
 # --- GROQ AI (OPZIONALE - DISABILITATO SE MANCA) ---
-try:
-    from poker_ai_advisor import PokerAIAdvisor
-    # Test import Groq
-    from groq import Groq
-    ai_advisor = PokerAIAdvisor()
-    print("✅ Groq AI Advisor caricato (Opzionale)")
-except ImportError:
-    print("⚠️ Libreria 'groq' non trovata. Il modulo 'Live Analyze' classico sarà disabilitato.")
-    print("   (Nessun problema: stiamo usando Vision AI!)")
-    ai_advisor = None
-except Exception as e:
-    print(f"⚠️ Errore inizializzazione Groq: {e}")
-    ai_advisor = None
+# Inizializzato allo startup (non all'import) per non rallentare l'avvio dei worker
+ai_advisor = None
+
+
+def _init_ai_advisor():
+    try:
+        from poker_ai_advisor import PokerAIAdvisor
+        advisor = PokerAIAdvisor()
+        logger.info("✅ Groq AI Advisor caricato (Opzionale)")
+        return advisor
+    except ImportError:
+        logger.info("⚠️ Libreria 'groq' non trovata. Il modulo 'Live Analyze' classico sarà disabilitato.")
+        logger.info("   (Nessun problema: stiamo usando Vision AI!)")
+    except Exception as e:
+        logger.warning(f"⚠️ Errore inizializzazione Groq: {e}")
+    return None
+
+
+def _create_mc_pool() -> ProcessPoolExecutor:
+    """
+    Pool di processi per il Monte Carlo (CPU-bound), uno per core fisico.
+
+    Worker avviati con 'spawn': un fork dopo l'avvio dei thread del server
+    (asyncio.to_thread) potrebbe copiare un lock già preso (es. logging).
+    """
+    workers = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Init/teardown nel loop di serving: advisor e pool MC allo startup, pool chiuso allo shutdown."""
+    global ai_advisor
+    app.state.mc_pool = _create_mc_pool()
+    ai_advisor = await asyncio.to_thread(_init_ai_advisor)
+    yield
+    # Chiude i worker del Monte Carlo senza bloccare il loop
+    await asyncio.to_thread(app.state.mc_pool.shutdown, cancel_futures=True)
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # --- ENDPOINT PER OVERLAY ---
 @api_router.get("/poker/live/latest")
 async def get_latest_analysis():
     """L'Overlay chiama questo endpoint per sapere cosa mostrare."""
-    return SharedState.latest_analysis
+    # Bytes pre-serializzati in SharedState.update(): nessun encoding JSON per ogni poll
+    return Response(content=SharedState.latest_analysis_bytes, media_type="application/json")
 
 # --- ROUTES BASE ---
 @api_router.get("/")
@@ -54,6 +91,3 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
@@ -2,23 +2,29 @@
 # Memoria condivisa per passare i dati dalla Vision AI all'Overlay
 from datetime import datetime
 
+import orjson
+
+
 class SharedState:
-    latest_analysis = {
+    # Solo il JSON già serializzato: l'overlay fa polling continuo e
+    # /poker/live/latest serve direttamente questi bytes.
+    # Sostituito in blocco da update() con un solo assegnamento (atomico sotto GIL).
+    latest_analysis_bytes = orjson.dumps({
         "recommended_action": "IN ATTESA",
         "recommended_amount": 0.0,
         "equity_estimate": 0.0,
         "confidence": 0.0,
         "ai_comment": "Avvia il client per iniziare...",
         "timestamp": None
-    }
+    })
 
     @classmethod
     def update(cls, result):
-        cls.latest_analysis = {
+        cls.latest_analysis_bytes = orjson.dumps({
             "recommended_action": result.get("recommended_action", "N/A"),
             "recommended_amount": result.get("recommended_amount", 0.0),
             "equity_estimate": result.get("equity_estimate", 0.0),
             "confidence": result.get("confidence", 0.0),
             "ai_comment": result.get("ai_comment", ""),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()  # orjson serializza datetime in ISO 8601 nativamente
+        })
@@ -1,185 +1,158 @@
 #!/usr/bin/env python3
 """
-TABLE LAYOUT - COORDINATE CARTE
-================================
+TABLE LAYOUT - CONFIGURAZIONE ROOM
+==================================
 
-ORDINE CAPO: Definizione coordinate per estrarre le 7 carte (5 board + 2 hero).
+ORDINE CAPO: Coordinate calibrate per room (rooms/*.json) e validazione bounds.
 
-Layout specifico per skin/risoluzione PokerStars.
-Coordinate relative alla finestra del tavolo (non schermo intero).
+Tutte le regioni sono (x, y, w, h) in pixel assoluti dello screenshot:
+- table_region, hero_cards (2), board_cards (5), hero_stack, pot
 
-Struttura:
-- hero_cards: [(x1, y1, w, h), (x2, y2, w, h)]
-- board_cards: [(x1, y1, w, h), ..., (x5, y5, w, h)]
+Il layout per skin con riconoscimento carte (TableLayout) sta in table_skin.py.
 """
 
-from typing import List, Tuple, Dict, Optional
-import cv2
+import os
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Annotated, List, Tuple
 import numpy as np
-from card_recognition_fullcard import FullCardRecognizer
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
 
 
-class TableLayout:
+Region = Tuple[int, int, int, int]
+
+
+class RoomConfigModel(BaseModel):
     """
-    Layout coordinate per un tavolo PokerStars.
+    Schema del JSON room: validazione strutturale fatta da pydantic-core.
     
-    ORDINE CAPO: Una classe per ogni skin/risoluzione.
+    Ogni regione è (x, y, w, h) con x, y >= 0 e w, h > 0.
     """
+    room_name: str
+    resolution: Tuple[PositiveInt, PositiveInt]
+    table_region: Tuple[NonNegativeInt, NonNegativeInt, PositiveInt, PositiveInt]
+    hero_cards: Annotated[
+        List[Tuple[NonNegativeInt, NonNegativeInt, PositiveInt, PositiveInt]],
+        Field(min_length=2, max_length=2)
+    ]
+    board_cards: Annotated[
+        List[Tuple[NonNegativeInt, NonNegativeInt, PositiveInt, PositiveInt]],
+        Field(min_length=5, max_length=5)
+    ]
+    hero_stack: Tuple[NonNegativeInt, NonNegativeInt, PositiveInt, PositiveInt]
+    pot: Tuple[NonNegativeInt, NonNegativeInt, PositiveInt, PositiveInt]
+
+
+@dataclass(frozen=True)
+class RoomConfig:
+    """
+    Configurazione calibrata di una room (vedi rooms/*.json).
     
-    def __init__(
-        self,
-        hero_cards: List[Tuple[int, int, int, int]],
-        board_cards: List[Tuple[int, int, int, int]],
-        name: str = "default"
-    ):
-        """
-        Args:
-            hero_cards: Lista di 2 tuple (x, y, w, h) per hero cards
-            board_cards: Lista di 5 tuple (x, y, w, h) per board cards
-            name: Nome del layout
-        """
-        self.hero_cards = hero_cards
-        self.board_cards = board_cards
-        self.name = name
+    Tutte le regioni sono (x, y, w, h) in pixel assoluti dello screenshot.
+    Frozen: la stessa istanza viene condivisa dalla cache di load_room_config.
+    """
+    room_name: str
+    resolution: Tuple[int, int]
+    table_region: Region
+    hero_cards: List[Region]
+    board_cards: List[Region]
+    hero_stack: Region
+    pot: Region
     
-    @classmethod
-    def pokerstars_1920x1080(cls):
-        """
-        Layout per PokerStars risoluzione 1920×1080, tavolo singolo centrato.
-        
-        TODO CAPO: Queste coordinate sono PLACEHOLDER.
-        Servono coordinate reali dal tuo setup.
-        """
-        # Placeholder - da calibrare
-        hero_cards = [
-            (860, 850, 80, 110),   # Hero card 1
-            (950, 850, 80, 110),   # Hero card 2
+    def named_regions(self) -> List[Tuple[str, Region]]:
+        """Tutte le regioni in ordine fisso, con nome leggibile per i warning."""
+        return [
+            ("table_region", self.table_region),
+            *((f"hero_card_{i+1}", r) for i, r in enumerate(self.hero_cards)),
+            *((f"board_card_{i+1}", r) for i, r in enumerate(self.board_cards)),
+            ("hero_stack", self.hero_stack),
+            ("pot", self.pot),
         ]
-        
-        board_cards = [
-            (650, 450, 80, 110),   # Board 1
-            (740, 450, 80, 110),   # Board 2
-            (830, 450, 80, 110),   # Board 3 (centro)
-            (920, 450, 80, 110),   # Board 4
-            (1010, 450, 80, 110),  # Board 5
-        ]
-        
-        return cls(hero_cards, board_cards, "pokerstars_1920x1080")
+    
+    @cached_property
+    def region_array(self) -> np.ndarray:
+        """Regioni impilate (N, 4) int32, stesso ordine di named_regions(). Read-only."""
+        regions = np.array([r for _, r in self.named_regions()], dtype=np.int32)
+        regions.flags.writeable = False
+        return regions
 
 
-def recognize_table_cards(
-    screen_gray: np.ndarray,
-    layout: TableLayout,
-    recognizer: FullCardRecognizer
-) -> Dict:
+def load_room_config(config_path: str) -> RoomConfig:
     """
-    ORDINE CAPO: Riconosce tutte le 7 carte da uno screenshot tavolo.
+    Carica la configurazione room da file JSON.
+    
+    Il parsing è in cache per (path assoluto, mtime): chiamate ripetute
+    sullo stesso file ritornano la stessa istanza, una modifica del JSON
+    invalida la cache automaticamente.
     
     Args:
-        screen_gray: Screenshot del tavolo in grayscale
-        layout: TableLayout con coordinate
-        recognizer: FullCardRecognizer inizializzato
+        config_path: Path del JSON (es: "rooms/pokerstars_6max.json")
         
     Returns:
-        Dict con struttura:
-        {
-            "hero": [
-                {"code": "Ah", "score": 0.95, "conf": "strong"},
-                {"code": "Kd", "score": 0.88, "conf": "strong"}
-            ],
-            "board": [
-                {"code": "7c", "score": 0.92, "conf": "strong"},
-                {"code": None, "score": 0.0, "conf": "none"},  # slot vuoto
-                ...
-            ]
-        }
+        RoomConfig con le regioni come tuple di int
+        
+    Raises:
+        FileNotFoundError: Se il file di configurazione non esiste
+        pydantic.ValidationError: Se il JSON non rispetta RoomConfigModel
     """
-    results = {
-        "hero": [],
-        "board": []
-    }
+    path = os.path.abspath(config_path)
     
-    # Riconosci hero cards
-    for (x, y, w, h) in layout.hero_cards:
-        crop = screen_gray[y:y+h, x:x+w]
-        code, score, conf = recognizer.recognize_card(crop)
-        results["hero"].append({
-            "code": code,
-            "score": score,
-            "conf": conf,
-        })
+    # EAFP: lo stat serve comunque per la chiave di cache, niente exists() separato
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    # Riconosci board cards
-    for (x, y, w, h) in layout.board_cards:
-        crop = screen_gray[y:y+h, x:x+w]
-        code, score, conf = recognizer.recognize_card(crop)
-        results["board"].append({
-            "code": code,
-            "score": score,
-            "conf": conf,
-        })
+    return _load_room_config_cached(path, mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_room_config_cached(path: str, mtime_ns: int) -> RoomConfig:
+    """Parsing + validazione del JSON (mtime_ns serve solo come chiave di cache)."""
+    with open(path, "rb") as f:
+        model = RoomConfigModel.model_validate_json(f.read())
     
-    return results
+    return RoomConfig(**model.model_dump())
 
 
-def visualize_layout(
-    screen: np.ndarray,
-    layout: TableLayout,
-    output_path: Optional[str] = None
+def region_bounds_mask(
+    room_config: RoomConfig,
+    image_width: int,
+    image_height: int
 ) -> np.ndarray:
     """
-    Visualizza le bounding box del layout su uno screenshot.
-    Utile per debug/calibrazione.
+    Verifica vettoriale dei bounds: True per ogni regione che esce dall'immagine.
     
-    Args:
-        screen: Screenshot (color o gray)
-        layout: TableLayout da visualizzare
-        output_path: Path dove salvare (opzionale)
-        
-    Returns:
-        Immagine con overlay delle box
+    L'ordine segue RoomConfig.named_regions().
     """
-    # Converti in color se necessario
-    if len(screen.shape) == 2:
-        vis = cv2.cvtColor(screen, cv2.COLOR_GRAY2BGR)
-    else:
-        vis = screen.copy()
-    
-    # Disegna hero cards (verde)
-    for i, (x, y, w, h) in enumerate(layout.hero_cards):
-        cv2.rectangle(vis, (x, y), (x+w, y+h), (0, 255, 0), 2)
-        cv2.putText(vis, f"H{i+1}", (x+5, y+20), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-    
-    # Disegna board cards (giallo)
-    for i, (x, y, w, h) in enumerate(layout.board_cards):
-        cv2.rectangle(vis, (x, y), (x+w, y+h), (0, 255, 255), 2)
-        cv2.putText(vis, f"B{i+1}", (x+5, y+20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-    
-    if output_path:
-        cv2.imwrite(output_path, vis)
-    
-    return vis
-
+    regions = room_config.region_array
+    xy = regions[:, :2]
+    br = xy + regions[:, 2:]
+    return (
+        (xy < 0).any(axis=1)
+        | (br[:, 0] > image_width)
+        | (br[:, 1] > image_height)
+    )
 
-# ============================================================================
-# TESTING
-# ============================================================================
 
-if __name__ == "__main__":
-    print("\n" + "="*80)
-    print("🎯 TABLE LAYOUT SYSTEM")
-    print("="*80 + "\n")
+def validate_coordinates(
+    room_config: RoomConfig,
+    image_width: int,
+    image_height: int
+) -> List[str]:
+    """
+    Controlla che tutte le regioni della room stiano dentro lo screenshot.
     
-    # Test layout
-    layout = TableLayout.pokerstars_1920x1080()
+    Il controllo è fatto in blocco con NumPy (region_bounds_mask);
+    le stringhe di warning vengono formattate solo per le regioni fuori.
     
-    print(f"Layout: {layout.name}")
-    print(f"Hero cards: {len(layout.hero_cards)}")
-    print(f"Board cards: {len(layout.board_cards)}")
+    Returns:
+        Lista di warning (vuota se tutto ok)
+    """
+    named = room_config.named_regions()
+    out_of_bounds = region_bounds_mask(room_config, image_width, image_height)
     
-    print("\n⚠️ NOTA CAPO:")
-    print("Queste coordinate sono PLACEHOLDER!")
-    print("Servono coordinate reali dal tuo setup PokerStars.")
-    print("\n" + "="*80 + "\n")
+    return [
+        f"{named[i][0]} {named[i][1]} exceeds image bounds {image_width}x{image_height}"
+        for i in np.nonzero(out_of_bounds)[0]
+    ]
@@ -8,8 +8,11 @@ Ordini del Capo - Fase 3: Region extraction without actual card/number recogniti
 """
 
 from PIL import Image
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import logging
+import numpy as np
 
 from table_layout import RoomConfig
 
@@ -18,6 +21,78 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _region_slices(table_shape, room_config: RoomConfig) -> Tuple[Tuple[slice, slice], ...]:
+    """
+    Clamped (rows, cols) slice pairs for every region, relative to the table.
+    
+    Row order follows RoomConfig.named_regions() without the table region:
+    hero cards, board cards, hero stack, pot. Coordinates are constant for
+    a given config and table size, so the slices are computed once and
+    cached: afterwards cutting is just indexing with prebuilt slices.
+    """
+    table_h, table_w = table_shape[:2]
+    return _compute_region_slices(room_config.region_array.tobytes(), table_w, table_h)
+
+
+@lru_cache(maxsize=16)
+def _compute_region_slices(region_bytes: bytes, table_w: int, table_h: int) -> Tuple[Tuple[slice, slice], ...]:
+    """Vectorized clamp of all regions (keyed on the raw int32 region_array bytes)."""
+    regions = np.frombuffer(region_bytes, dtype=np.int32).reshape(-1, 4)
+    table_xy = regions[0, :2]
+    limits = np.array([table_w, table_h], dtype=np.int32)
+    
+    # Adjust coordinates relative to table region and clamp to image bounds
+    xy1 = np.clip(regions[1:, :2] - table_xy, 0, limits)
+    xy2 = np.clip(xy1 + regions[1:, 2:], xy1, limits)
+    
+    return tuple(
+        (slice(int(y1), int(y2)), slice(int(x1), int(x2)))
+        for (x1, y1), (x2, y2) in zip(xy1, xy2)
+    )
+
+
+def cut_all_regions(table_np: np.ndarray, room_config: RoomConfig) -> Dict[str, Any]:
+    """
+    Extract every region from the table image in one pass.
+    
+    Regions are returned as NumPy views (zero-copy slices) of table_np;
+    wrap them with Image.fromarray only where a PIL Image is needed.
+    
+    Args:
+        table_np: Cropped table image as array (e.g. np.asarray(table_image))
+        room_config: Room configuration with region coordinates
+        
+    Returns:
+        Dict with keys 'hero_cards', 'board_cards' (lists of arrays),
+        'pot_region' and 'hero_stack_region' (arrays)
+    """
+    crops = [table_np[rows, cols] for rows, cols in _region_slices(table_np.shape, room_config)]
+    
+    n_hero = len(room_config.hero_cards)
+    n_board = len(room_config.board_cards)
+    
+    regions = {
+        'hero_cards': crops[:n_hero],
+        'board_cards': crops[n_hero:n_hero + n_board],
+        'hero_stack_region': crops[-2],
+        'pot_region': crops[-1],
+    }
+    
+    logger.info(f"Extracted {n_hero} hero cards, {n_board} board cards, pot and hero stack regions")
+    return regions
+
+
+# Legacy per-region API: same output as before (PIL Images).
+# Each wrapper crops only its own cached slices from the PIL image (no
+# full-frame array copy); prefer cut_all_regions() when more than one
+# region is needed.
+
+def _crop_region(table_image: Image.Image, room_config: RoomConfig, index: int) -> Image.Image:
+    """PIL crop of one region, using the cached slices from _region_slices."""
+    rows, cols = _region_slices((table_image.height, table_image.width), room_config)[index]
+    return table_image.crop((cols.start, rows.start, cols.stop, rows.stop))
+
+
 def cut_hero_cards(table_image: Image.Image, room_config: RoomConfig) -> List[Image.Image]:
     """
     Extract hero card regions from the table image.
@@ -31,35 +106,15 @@ def cut_hero_cards(table_image: Image.Image, room_config: RoomConfig) -> List[Im
     """
     hero_cards = []
     
-    # Get table region offset for coordinate adjustment
-    table_x, table_y, _, _ = room_config.table_region
-    
-    for i, card_coords in enumerate(room_config.hero_cards):
+    for i in range(len(room_config.hero_cards)):
         try:
-            # Adjust coordinates relative to table region
-            x, y, width, height = card_coords
-            x_rel = x - table_x
-            y_rel = y - table_y
-            
-            # Ensure coordinates are within table image bounds
-            x_rel = max(0, min(x_rel, table_image.width))
-            y_rel = max(0, min(y_rel, table_image.height))
-            x2 = min(x_rel + width, table_image.width)
-            y2 = min(y_rel + height, table_image.height)
-            
-            # Crop the card region
-            card_image = table_image.crop((x_rel, y_rel, x2, y2))
-            hero_cards.append(card_image)
-            
-            logger.debug(f"Cut hero card {i+1}: ({x_rel}, {y_rel}) to ({x2}, {y2}) -> {card_image.width}x{card_image.height}")
-            
+            hero_cards.append(_crop_region(table_image, room_config, i))
         except Exception as e:
             logger.error(f"Error cutting hero card {i+1}: {e}")
             # Create a blank image as fallback
-            blank_card = Image.new('RGB', (60, 85), color='gray')
-            hero_cards.append(blank_card)
+            hero_cards.append(Image.new('RGB', (60, 85), color='gray'))
     
-    logger.info(f"Extracted {len(hero_cards)} hero cards")
+    logger.debug(f"Extracted {len(hero_cards)} hero cards")
     return hero_cards
 
 
@@ -75,38 +130,17 @@ def cut_board_cards(table_image: Image.Image, room_config: RoomConfig) -> List[I
         List of PIL Images for board cards (flop, turn, river - 5 total)
     """
     board_cards = []
+    n_hero = len(room_config.hero_cards)
     
-    # Get table region offset for coordinate adjustment
-    table_x, table_y, _, _ = room_config.table_region
-    
-    for i, card_coords in enumerate(room_config.board_cards):
+    for i in range(len(room_config.board_cards)):
         try:
-            # Adjust coordinates relative to table region
-            x, y, width, height = card_coords
-            x_rel = x - table_x
-            y_rel = y - table_y
-            
-            # Ensure coordinates are within table image bounds
-            x_rel = max(0, min(x_rel, table_image.width))
-            y_rel = max(0, min(y_rel, table_image.height))
-            x2 = min(x_rel + width, table_image.width)
-            y2 = min(y_rel + height, table_image.height)
-            
-            # Crop the card region
-            card_image = table_image.crop((x_rel, y_rel, x2, y2))
-            board_cards.append(card_image)
-            
-            card_names = ['Flop 1', 'Flop 2', 'Flop 3', 'Turn', 'River']
-            card_name = card_names[i] if i < len(card_names) else f'Board {i+1}'
-            logger.debug(f"Cut {card_name}: ({x_rel}, {y_rel}) to ({x2}, {y2}) -> {card_image.width}x{card_image.height}")
-            
+            board_cards.append(_crop_region(table_image, room_config, n_hero + i))
         except Exception as e:
             logger.error(f"Error cutting board card {i+1}: {e}")
             # Create a blank image as fallback
-            blank_card = Image.new('RGB', (60, 85), color='gray')
-            board_cards.append(blank_card)
+            board_cards.append(Image.new('RGB', (60, 85), color='gray'))
     
-    logger.info(f"Extracted {len(board_cards)} board cards")
+    logger.debug(f"Extracted {len(board_cards)} board cards")
     return board_cards
 
 
@@ -122,33 +156,13 @@ def cut_pot_region(table_image: Image.Image, room_config: RoomConfig) -> Image.I
         PIL Image of the pot region
     """
     try:
-        # Get table region offset for coordinate adjustment
-        table_x, table_y, _, _ = room_config.table_region
-        
-        # Adjust coordinates relative to table region
-        x, y, width, height = room_config.pot
-        x_rel = x - table_x
-        y_rel = y - table_y
-        
-        # Ensure coordinates are within table image bounds
-        x_rel = max(0, min(x_rel, table_image.width))
-        y_rel = max(0, min(y_rel, table_image.height))
-        x2 = min(x_rel + width, table_image.width)
-        y2 = min(y_rel + height, table_image.height)
-        
-        # Crop the pot region
-        pot_image = table_image.crop((x_rel, y_rel, x2, y2))
-        
-        logger.debug(f"Cut pot region: ({x_rel}, {y_rel}) to ({x2}, {y2}) -> {pot_image.width}x{pot_image.height}")
-        logger.info("Extracted pot region")
-        
+        pot_image = _crop_region(table_image, room_config, -1)
+        logger.debug("Extracted pot region")
         return pot_image
-        
     except Exception as e:
         logger.error(f"Error cutting pot region: {e}")
         # Create a blank image as fallback
-        blank_pot = Image.new('RGB', (100, 25), color='gray')
-        return blank_pot
+        return Image.new('RGB', (100, 25), color='gray')
 
 
 def cut_hero_stack_region(table_image: Image.Image, room_config: RoomConfig) -> Image.Image:
@@ -163,41 +177,30 @@ def cut_hero_stack_region(table_image: Image.Image, room_config: RoomConfig) ->
         PIL Image of the hero stack region
     """
     try:
-        # Get table region offset for coordinate adjustment
-        table_x, table_y, _, _ = room_config.table_region
-        
-        # Adjust coordinates relative to table region
-        x, y, width, height = room_config.hero_stack
-        x_rel = x - table_x
-        y_rel = y - table_y
-        
-        # Ensure coordinates are within table image bounds
-        x_rel = max(0, min(x_rel, table_image.width))
-        y_rel = max(0, min(y_rel, table_image.height))
-        x2 = min(x_rel + width, table_image.width)
-        y2 = min(y_rel + height, table_image.height)
-        
-        # Crop the hero stack region
-        stack_image = table_image.crop((x_rel, y_rel, x2, y2))
-        
-        logger.debug(f"Cut hero stack region: ({x_rel}, {y_rel}) to ({x2}, {y2}) -> {stack_image.width}x{stack_image.height}")
-        logger.info("Extracted hero stack region")
-        
+        stack_image = _crop_region(table_image, room_config, -2)
+        logger.debug("Extracted hero stack region")
         return stack_image
-        
     except Exception as e:
         logger.error(f"Error cutting hero stack region: {e}")
         # Create a blank image as fallback
-        blank_stack = Image.new('RGB', (120, 30), color='gray')
-        return blank_stack
+        return Image.new('RGB', (120, 30), color='gray')
+
+
+def _as_pil(image) -> Image.Image:
+    """Wrap a NumPy region as PIL Image (no-op for PIL Images)."""
+    return Image.fromarray(image) if isinstance(image, np.ndarray) else image
 
 
 def save_regions(hero_cards: List[Image.Image], board_cards: List[Image.Image], 
-                pot_image: Image.Image, stack_image: Image.Image, 
+                pot_image: Optional[Image.Image], stack_image: Optional[Image.Image], 
                 output_dir: str) -> None:
     """
     Save all extracted regions to files with clear naming convention.
     
+    Regions can be PIL Images or NumPy arrays (from cut_all_regions);
+    arrays are wrapped as PIL only here, right before writing the PNG.
+    None pot/stack regions are skipped.
+    
     Args:
         hero_cards: List of hero card images
         board_cards: List of board card images  
@@ -210,26 +213,25 @@ def save_regions(hero_cards: List[Image.Image], board_cards: List[Image.Image],
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
+    # (image, filename) in the same order as the previous sequential saves
+    jobs = [(card, f"hero_card_{i+1}.png") for i, card in enumerate(hero_cards)]
+    jobs += [(card, f"board_card_{i+1}.png") for i, card in enumerate(board_cards)]
+    if pot_image is not None:
+        jobs.append((pot_image, "pot_region.png"))
+    if stack_image is not None:
+        jobs.append((stack_image, "hero_stack_region.png"))
+    
+    def _save(job) -> str:
+        image, filename = job
+        # Debug dumps: fast deflate, no optimize pass
+        _as_pil(image).save(output_path / filename, compress_level=1, optimize=False)
+        return filename
+    
     try:
-        # Save hero cards
-        for i, card_image in enumerate(hero_cards):
-            filename = f"hero_card_{i+1}.png"
-            card_image.save(output_path / filename)
-            logger.info(f"Saved {filename}")
-        
-        # Save board cards
-        for i, card_image in enumerate(board_cards):
-            filename = f"board_card_{i+1}.png"
-            card_image.save(output_path / filename)
-            logger.info(f"Saved {filename}")
-        
-        # Save pot region
-        pot_image.save(output_path / "pot_region.png")
-        logger.info("Saved pot_region.png")
-        
-        # Save hero stack region
-        stack_image.save(output_path / "hero_stack_region.png")
-        logger.info("Saved hero_stack_region.png")
+        # PIL releases the GIL in the PNG encoder: saves overlap across threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for filename in executor.map(_save, jobs):
+                logger.info(f"Saved {filename}")
         
         logger.info(f"All regions saved to {output_path}")
         
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TABLE SKIN - COORDINATE CARTE PER SKIN/RISOLUZIONE
+===================================================
+
+ORDINE CAPO: Definizione coordinate per estrarre le 7 carte (5 board + 2 hero).
+
+Layout specifico per skin/risoluzione PokerStars.
+Coordinate relative alla finestra del tavolo (non schermo intero).
+
+Struttura:
+- hero_cards: [(x1, y1, w, h), (x2, y2, w, h)]
+- board_cards: [(x1, y1, w, h), ..., (x5, y5, w, h)]
+
+Le configurazioni room calibrate da JSON (RoomConfig) stanno in table_layout.py.
+"""
+
+from typing import List, Tuple, Dict, Optional
+import cv2
+import numpy as np
+from card_recognition_fullcard import FullCardRecognizer
+
+
+class TableLayout:
+    """
+    Layout coordinate per un tavolo PokerStars.
+    
+    ORDINE CAPO: Una classe per ogni skin/risoluzione.
+    """
+    
+    def __init__(
+        self,
+        hero_cards: List[Tuple[int, int, int, int]],
+        board_cards: List[Tuple[int, int, int, int]],
+        name: str = "default"
+    ):
+        """
+        Args:
+            hero_cards: Lista di 2 tuple (x, y, w, h) per hero cards
+            board_cards: Lista di 5 tuple (x, y, w, h) per board cards
+            name: Nome del layout
+        """
+        # Tutte le box in un unico buffer (N, 4) int32 read-only: hero prima, poi board
+        self.rects = np.array([*hero_cards, *board_cards], dtype=np.int32).reshape(-1, 4)
+        self.rects.flags.writeable = False
+        self.n_hero = len(hero_cards)
+        self.name = name
+    
+    @property
+    def hero_cards(self) -> np.ndarray:
+        """Box hero (view di self.rects)."""
+        return self.rects[:self.n_hero]
+    
+    @property
+    def board_cards(self) -> np.ndarray:
+        """Box board (view di self.rects)."""
+        return self.rects[self.n_hero:]
+    
+    @classmethod
+    def pokerstars_1920x1080(cls):
+        """
+        Layout per PokerStars risoluzione 1920×1080, tavolo singolo centrato.
+        
+        TODO CAPO: Queste coordinate sono PLACEHOLDER.
+        Servono coordinate reali dal tuo setup.
+        """
+        # Placeholder - da calibrare
+        hero_cards = [
+            (860, 850, 80, 110),   # Hero card 1
+            (950, 850, 80, 110),   # Hero card 2
+        ]
+        
+        board_cards = [
+            (650, 450, 80, 110),   # Board 1
+            (740, 450, 80, 110),   # Board 2
+            (830, 450, 80, 110),   # Board 3 (centro)
+            (920, 450, 80, 110),   # Board 4
+            (1010, 450, 80, 110),  # Board 5
+        ]
+        
+        return cls(hero_cards, board_cards, "pokerstars_1920x1080")
+
+
+def recognize_table_cards(
+    screen_gray: np.ndarray,
+    layout: TableLayout,
+    recognizer: FullCardRecognizer
+) -> Dict:
+    """
+    ORDINE CAPO: Riconosce tutte le 7 carte da uno screenshot tavolo.
+    
+    Args:
+        screen_gray: Screenshot del tavolo in grayscale
+        layout: TableLayout con coordinate
+        recognizer: FullCardRecognizer inizializzato
+        
+    Returns:
+        Dict con struttura:
+        {
+            "hero": [
+                {"code": "Ah", "score": 0.95, "conf": "strong"},
+                {"code": "Kd", "score": 0.88, "conf": "strong"}
+            ],
+            "board": [
+                {"code": "7c", "score": 0.92, "conf": "strong"},
+                {"code": None, "score": 0.0, "conf": "none"},  # slot vuoto
+                ...
+            ]
+        }
+    """
+    # Tutte le 7 carte in un solo batch (una matmul contro i 52 template)
+    n_hero = layout.n_hero
+    slot_keys = [f"hero{i}" for i in range(n_hero)] + \
+                [f"board{i}" for i in range(len(layout.rects) - n_hero)]
+    matches = [
+        {"code": code, "score": score, "conf": conf}
+        for code, score, conf in recognizer.recognize_regions(screen_gray, layout.rects, slot_keys)
+    ]
+    
+    results = {
+        "hero": matches[:n_hero],
+        "board": matches[n_hero:]
+    }
+    
+    return results
+
+
+def _box_polygons(boxes: List[Tuple[int, int, int, int]]) -> np.ndarray:
+    """Converte box (x, y, w, h) in poligoni (N, 4, 2) int32 per cv2.polylines."""
+    xywh = np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+    x, y = xywh[:, 0], xywh[:, 1]
+    x2, y2 = x + xywh[:, 2], y + xywh[:, 3]
+    return np.stack([
+        np.stack([x, y], axis=1),
+        np.stack([x2, y], axis=1),
+        np.stack([x2, y2], axis=1),
+        np.stack([x, y2], axis=1),
+    ], axis=1)
+
+
+def visualize_layout(
+    screen: np.ndarray,
+    layout: TableLayout,
+    output_path: Optional[str] = None
+) -> np.ndarray:
+    """
+    Visualizza le bounding box del layout su uno screenshot.
+    Utile per debug/calibrazione.
+    
+    Args:
+        screen: Screenshot (color o gray)
+        layout: TableLayout da visualizzare
+        output_path: Path dove salvare (opzionale)
+        
+    Returns:
+        Immagine con overlay delle box
+    """
+    # Converti in color se necessario
+    if len(screen.shape) == 2:
+        vis = cv2.cvtColor(screen, cv2.COLOR_GRAY2BGR)
+    else:
+        vis = screen.copy()
+    
+    # Box: una sola cv2.polylines per gruppo (hero verde, board giallo)
+    for boxes, prefix, color in (
+        (layout.hero_cards, "H", (0, 255, 0)),
+        (layout.board_cards, "B", (0, 255, 255)),
+    ):
+        cv2.polylines(vis, _box_polygons(boxes), True, color, 2)
+        for i, (x, y, w, h) in enumerate(boxes):
+            cv2.putText(vis, f"{prefix}{i+1}", (x+5, y+20),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+    
+    if output_path:
+        # Overlay di debug: compressione PNG minima (deflate veloce, file solo per l'occhio umano)
+        cv2.imwrite(output_path, vis, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    
+    return vis
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("\n" + "="*80)
+    print("🎯 TABLE LAYOUT SYSTEM")
+    print("="*80 + "\n")
+    
+    # Test layout
+    layout = TableLayout.pokerstars_1920x1080()
+    
+    print(f"Layout: {layout.name}")
+    print(f"Hero cards: {len(layout.hero_cards)}")
+    print(f"Board cards: {len(layout.board_cards)}")
+    
+    print("\n⚠️ NOTA CAPO:")
+    print("Queste coordinate sono PLACEHOLDER!")
+    print("Servono coordinate reali dal tuo setup PokerStars.")
+    print("\n" + "="*80 + "\n")
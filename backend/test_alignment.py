@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 import json
 import requests
+from requests.adapters import HTTPAdapter
 
 # Add the backend directory to the path
 sys.path.append(str(Path(__file__).parent))
@@ -31,12 +32,17 @@ def test_alignment():
     console_equity_engine = MockEquityEngine(enable_random=False)
     console_decision_engine = DecisionEngine()
     
+    # Sessione unica: la connessione keep-alive viene riusata per tutte le mani
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    
     # Reset web demo
     try:
-        start_response = requests.get("http://localhost:8001/api/poker/demo/start")
+        start_response = session.get("http://localhost:8001/api/poker/demo/start", timeout=5)
         print(f"✅ Web demo avviato: {start_response.json()}")
     except Exception as e:
         print(f"❌ Errore avvio web demo: {e}")
+        session.close()
         return
     
     print()
@@ -55,7 +61,7 @@ def test_alignment():
         
         # Web API logic
         try:
-            api_response = requests.get("http://localhost:8001/api/poker/demo/next")
+            api_response = session.get("http://localhost:8001/api/poker/demo/next", timeout=5)
             api_data = api_response.json()
             
             web_hand = api_data['hand_state']
@@ -89,6 +95,8 @@ def test_alignment():
             print(f"❌ Errore API: {e}")
             mismatches += 1
     
+    session.close()
+    
     print()
     print("="*60)
     print("RISULTATI TEST ALLINEAMENTO")
@@ -6,13 +6,40 @@ Testa l'estrazione delle regioni su tutti gli screenshot rinominati
 per verificare che le coordinate funzionino per tutte le fasi della mano.
 """
 
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
 
 from analyze_screenshot import analyze_screenshot
 
+def _run_one(job):
+    """
+    Worker: analizza uno screenshot in un processo separato.
+    
+    L'output di analyze_screenshot viene catturato e ritornato, così il
+    report finale resta leggibile invece di mescolare i print dei worker.
+    
+    Returns:
+        (success, log, error) - error è "missing" se il file non esiste
+    """
+    config_path, screenshot_path, output_dir = job
+    
+    if not Path(screenshot_path).exists():
+        return False, "", "missing"
+    
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            success = analyze_screenshot(config_path, screenshot_path, output_dir)
+        return success, log.getvalue(), None
+    except Exception as e:
+        return False, log.getvalue(), str(e)
+
+
 def test_all_pokerstars_screenshots():
     """
     Testa tutti gli screenshot PokerStars disponibili.
@@ -40,36 +67,42 @@ def test_all_pokerstars_screenshots():
     success_count = 0
     total_count = len(screenshot_files)
     
-    for i, filename in enumerate(screenshot_files, 1):
-        screenshot_path = screenshots_dir / filename
-        
+    # Screenshot indipendenti: analisi in parallelo su processi separati
+    jobs = []
+    for filename in screenshot_files:
+        # Crea directory di output specifica per ogni screenshot
+        output_dir = f"output_regions_{filename.split('.')[0].split('_')[1]}"  # es: output_regions_preflop
+        jobs.append((config_path, str(screenshots_dir / filename), output_dir))
+    
+    with ProcessPoolExecutor(max_workers=min(total_count, os.cpu_count() or 1)) as executor:
+        outcomes = list(executor.map(_run_one, jobs))
+    
+    # Report nello stesso ordine (e formato) dell'esecuzione sequenziale
+    for i, (filename, (_, screenshot_path, output_dir), (success, log, error)) in enumerate(
+        zip(screenshot_files, jobs, outcomes), 1
+    ):
         print(f"📷 Testing {i}/{total_count}: {filename}")
         
-        if not screenshot_path.exists():
+        if error == "missing":
             print(f"   ❌ File not found: {screenshot_path}")
             continue
         
-        # Crea directory di output specifica per ogni screenshot
-        output_dir = f"output_regions_{filename.split('.')[0].split('_')[1]}"  # es: output_regions_preflop
+        print(log, end="")
         
-        try:
-            success = analyze_screenshot(str(config_path), str(screenshot_path), output_dir)
+        if error:
+            print(f"   ❌ ERROR: {error}")
+        elif success:
+            print(f"   ✅ SUCCESS: Regions extracted to {output_dir}/")
+            success_count += 1
+            
+            # Conta i file estratti
+            output_path = Path(output_dir)
+            if output_path.exists():
+                extracted_files = list(output_path.glob("*.png"))
+                print(f"      📊 Extracted {len(extracted_files)} region files")
             
-            if success:
-                print(f"   ✅ SUCCESS: Regions extracted to {output_dir}/")
-                success_count += 1
-                
-                # Conta i file estratti
-                output_path = Path(output_dir)
-                if output_path.exists():
-                    extracted_files = list(output_path.glob("*.png"))
-                    print(f"      📊 Extracted {len(extracted_files)} region files")
-                
-            else:
-                print(f"   ❌ FAILED: Error during region extraction")
-                
-        except Exception as e:
-            print(f"   ❌ ERROR: {e}")
+        else:
+            print(f"   ❌ FAILED: Error during region extraction")
         
         print()
     
@@ -4,6 +4,7 @@ Test automatico del DEMO 1 Console Ufficiale - Poker Bot
 Esegue tutte le 8 mani senza richiedere input utente per testing completo.
 """
 
+import io
 import sys
 import os
 from pathlib import Path
@@ -11,13 +12,29 @@ from pathlib import Path
 # Add the backend directory to the path so we can import server modules
 sys.path.append(str(Path(__file__).parent))
 
-from server import MockStateProvider, MockEquityEngine, DecisionEngine, HandState
+# Blocco di output per ogni mano (template compilato una volta sola)
+HAND_TEMPLATE = (
+    "===== Mano {hand_count}/{total_hands} =====\n"
+    "Fase: {phase}\n"
+    "Carte Hero: {hero}\n"
+    "Carte Board: {board}\n"
+    "Piatto: ${pot_size:.2f}\n"
+    "Da chiamare: ${to_call:.2f}\n"
+    "Stack Hero: ${hero_stack:.2f}\n"
+    "Giocatori in mano: {players_in_hand}\n"
+    "\n"
+    "Equity stimata: {equity:.1f}%\n"
+    "Azione consigliata: {action}\n"
+)
 
 def test_console_demo():
     """
     Testa il console demo eseguendo tutte le mani automaticamente.
     """
     
+    # Import lazy: il server (FastAPI, OpenCV, ...) viene caricato solo quando il demo gira
+    from server import MockStateProvider, MockEquityEngine, DecisionEngine
+    
     # Inizializzazione moduli backend (stessa logica del web demo)
     provider = MockStateProvider()
     equity_engine = MockEquityEngine(enable_random=True)  # Randomness abilitata per demo
@@ -45,40 +62,33 @@ def test_console_demo():
         if hand_state is None:
             break
             
-        # 2. Stampa informazioni mano
-        print(f"===== Mano {hand_count}/{total_hands} =====")
-        print(f"Fase: {hand_state.phase}")
-        print(f"Carte Hero: {' '.join(hand_state.hero_cards)}")
-        
-        # Board cards (o "nessuna" per preflop)
-        if hand_state.board_cards and len(hand_state.board_cards) > 0:
-            print(f"Carte Board: {' '.join(hand_state.board_cards)}")
-        else:
-            print("Carte Board: nessuna")
-            
-        print(f"Piatto: ${hand_state.pot_size:.2f}")
-        print(f"Da chiamare: ${hand_state.to_call:.2f}")
-        print(f"Stack Hero: ${hand_state.hero_stack:.2f}")
-        print(f"Giocatori in mano: {hand_state.players_in_hand}")
-        print()
-        
-        # 3. Calcola equity
+        # 2. Calcola equity
         equity = equity_engine.compute_equity(hand_state)
-        print(f"Equity stimata: {equity:.1f}%")
         
-        # 4. Calcola decisione
+        # 3. Calcola decisione
         decision = decision_engine.decide_action(hand_state, equity)
         
-        # 5. Mostra decisione
-        print(f"Azione consigliata: {decision.action}")
+        # 4. Mostra mano + decisione: output bufferizzato, una sola write per mano
+        buf = io.StringIO()
+        buf.write(HAND_TEMPLATE.format(
+            **vars(hand_state),
+            hand_count=hand_count,
+            total_hands=total_hands,
+            hero=' '.join(hand_state.hero_cards),
+            # Board cards (o "nessuna" per preflop)
+            board=' '.join(hand_state.board_cards) if hand_state.board_cards else "nessuna",
+            equity=equity,
+            action=decision.action,
+        ))
         if decision.action == "RAISE" and decision.raise_amount > 0:
-            print(f"Importo raise: ${decision.raise_amount:.2f}")
+            print(f"Importo raise: ${decision.raise_amount:.2f}", file=buf)
         if decision.reason:
-            print(f"Ragione: {decision.reason}")
+            print(f"Ragione: {decision.reason}", file=buf)
         
-        print()
-        print("-" * 50)
-        print()
+        print(file=buf)
+        print("-" * 50, file=buf)
+        print(file=buf)
+        sys.stdout.write(buf.getvalue())
     
     # Fine demo
     print("Fine DEMO 1 – Nessun'altra mano mock disponibile.")
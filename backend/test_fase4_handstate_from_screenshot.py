@@ -8,21 +8,45 @@ Validazione end-to-end dell'integrazione visione-logica poker.
 Ordini del Capo - Fase 4: Validation finale screenshot → HandState → EquityEngine → DecisionEngine.
 """
 
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import Dict, List
-import json
+from typing import TYPE_CHECKING, Dict, List
 
-# Import Fase 4 modules
-from vision_to_handstate import VisionPokerEngine
+import orjson
+
+if TYPE_CHECKING:
+    from vision_to_handstate import VisionPokerEngine
+    from server import MockEquityEngine, DecisionEngine
+
+
+def create_engines():
+    """
+    Crea (VisionPokerEngine, MockEquityEngine, DecisionEngine).
+    
+    Import lazy: OpenCV, NumPy e il server vengono caricati solo quando
+    si esegue davvero la pipeline, non al semplice import del modulo.
+    """
+    # Import Fase 4 modules
+    from vision_to_handstate import VisionPokerEngine
+    
+    # Import existing poker logic (Fasi 1-2)
+    from server import MockEquityEngine, DecisionEngine
+    
+    return (
+        VisionPokerEngine(),
+        MockEquityEngine(enable_random=False),  # Deterministic for testing
+        DecisionEngine(),
+    )
 
-# Import existing poker logic (Fasi 1-2)  
-from server import MockEquityEngine, DecisionEngine
 
 def test_complete_pipeline_on_screenshot(screenshot_path: str, 
-                                       engine: VisionPokerEngine,
-                                       equity_engine: MockEquityEngine,
-                                       decision_engine: DecisionEngine) -> Dict:
+                                       engine: "VisionPokerEngine",
+                                       equity_engine: "MockEquityEngine",
+                                       decision_engine: "DecisionEngine") -> Dict:
     """
     Test complete pipeline: Screenshot → HandState → Equity → Decision.
     
@@ -113,8 +137,34 @@ def test_complete_pipeline_on_screenshot(screenshot_path: str,
     return results
 
 
-def test_all_screenshots():
-    """Test the complete pipeline on all available screenshots."""
+# Engine per processo worker (creati alla prima mano, nessuno stato condiviso tra processi)
+_WORKER_ENGINES = None
+
+
+def _run_pipeline_worker(screenshot_path: str):
+    """
+    Worker: esegue la pipeline completa su uno screenshot in un processo separato.
+    
+    L'output viene catturato e ritornato per stamparlo in ordine nel processo padre.
+    """
+    global _WORKER_ENGINES
+    if _WORKER_ENGINES is None:
+        _WORKER_ENGINES = create_engines()
+    
+    log = io.StringIO()
+    with redirect_stdout(log):
+        result = test_complete_pipeline_on_screenshot(screenshot_path, *_WORKER_ENGINES)
+    return result, log.getvalue()
+
+
+def test_all_screenshots(serial: bool = False):
+    """
+    Test the complete pipeline on all available screenshots.
+    
+    Args:
+        serial: Run in-process one screenshot at a time (debug); by default
+            the screenshots are processed in parallel worker processes
+    """
     
     print("🎯 FASE 4 - COMPLETE PIPELINE TESTING")
     print("=" * 70)
@@ -122,9 +172,7 @@ def test_all_screenshots():
     
     # Initialize engines
     print("⚙️  Initializing engines...")
-    vision_engine = VisionPokerEngine()
-    equity_engine = MockEquityEngine(enable_random=False)  # Deterministic for testing
-    decision_engine = DecisionEngine()
+    vision_engine, equity_engine, decision_engine = create_engines()
     
     # Check vision engine readiness
     status = vision_engine.get_engine_status()
@@ -146,20 +194,33 @@ def test_all_screenshots():
     all_results = []
     success_count = 0
     
+    available = []
     for screenshot_path in screenshots:
         if Path(screenshot_path).exists():
-            result = test_complete_pipeline_on_screenshot(
-                screenshot_path, vision_engine, equity_engine, decision_engine
-            )
-            all_results.append(result)
-            
-            if result["pipeline_success"]:
-                success_count += 1
-            
-            print()
+            available.append(screenshot_path)
         else:
             print(f"⏩ Skipping {screenshot_path} (not found)")
     
+    if serial:
+        outcomes = (
+            (test_complete_pipeline_on_screenshot(path, vision_engine, equity_engine, decision_engine), "")
+            for path in available
+        )
+    else:
+        # Screenshot indipendenti: template matching in parallelo su più core
+        workers = max(1, min(4, len(available), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_run_pipeline_worker, available))
+    
+    for result, log in outcomes:
+        print(log, end="")
+        all_results.append(result)
+        
+        if result["pipeline_success"]:
+            success_count += 1
+        
+        print()
+    
     # Final summary
     print("=" * 70)
     print("FINAL RESULTS SUMMARY")
@@ -218,8 +279,10 @@ def save_test_results(results: List[Dict], output_file: str = "fase4_test_result
     """Save test results to JSON file for analysis."""
     
     try:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # orjson serializza direttamente anche i valori numpy (es. equity float32)
+        Path(output_file).write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
         
         print(f"📊 Test results saved to: {output_file}")
         
@@ -237,8 +300,8 @@ def main():
     print("Pipeline: Fase 3 (regions) + Fase 4 (recognition) + Fase 2 (logic)")
     print()
     
-    # Run complete tests
-    results = test_all_screenshots()
+    # Run complete tests (--serial: niente worker, utile per il debug)
+    results = test_all_screenshots(serial="--serial" in sys.argv)
     
     # Save results for analysis
     save_test_results(results)
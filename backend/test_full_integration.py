@@ -9,6 +9,9 @@ Simula il flusso completo senza bisogno di screenshot reale:
 
 Questo dimostra che tutto il sistema è collegato e funzionante.
 """
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import json
 from bridge_tablestate_to_ai import (
@@ -17,6 +20,28 @@ from bridge_tablestate_to_ai import (
 )
 
 
+def _write_lines(lines):
+    """Scrive un blocco di righe con una sola write su stdout."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _comment_box_lines(comment: str, max_lines: int = 3):
+    """
+    Righe del commento AI dentro il box overlay (max 3 righe, 80 caratteri).
+    """
+    # Commento troncato
+    if len(comment) > 80:
+        comment = comment[:77] + "..."
+    
+    # Split in righe per visualizzazione (spazi/a capo normalizzati come split())
+    wrapped = textwrap.wrap(
+        " ".join(comment.split()), width=44,
+        initial_indent="   │  💬 ", subsequent_indent="   │     ",
+        break_long_words=False, break_on_hyphens=False
+    ) or ["   │  💬 "]
+    return [(line + " ").ljust(43) + "│" for line in wrapped[:max_lines]]
+
+
 def test_integration_with_mock_cards():
     """Test integrazione con carte mock."""
     print("\n" + "╔" + "═" * 68 + "╗")
@@ -54,19 +79,11 @@ def test_integration_with_mock_cards():
         }
     ]
     
-    for i, scenario in enumerate(scenarios, 1):
-        print("=" * 70)
-        print(f"TEST {i}/3: {scenario['name']}")
-        print("=" * 70)
-        
-        # 1. OCCHI: Screenshot → Riconoscimento (simulato)
-        print("\n👁️  FASE 1: OCCHI (Screenshot Recognition)")
-        print(f"   Hero riconosciute:  {scenario['hero']}")
-        print(f"   Board riconosciute: {scenario['board']}")
-        
-        # 2. Build stato tavolo per AI
-        print("\n📊 FASE 2: Costruzione Stato Tavolo")
-        table_state = build_live_table_state(
+    # Stati tavolo costruiti subito, così le chiamate AI (indipendenti,
+    # network-bound) partono in parallelo: il tempo totale è quello della
+    # chiamata più lenta, non la somma. L'output resta nell'ordine degli scenari.
+    table_states = [
+        build_live_table_state(
             table_id=1,
             hero_cards=scenario['hero'],
             board_cards=scenario['board'],
@@ -77,30 +94,46 @@ def test_integration_with_mock_cards():
             players=2,
             big_blind=1.0
         )
-        print(f"   Street: {table_state['street']}")
-        print(f"   Pot: ${table_state['pot_size']:.2f}")
-        print(f"   To call: ${table_state['to_call']:.2f}")
+        for scenario in scenarios
+    ]
+    with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+        ai_results = list(executor.map(analyze_table_with_ai, table_states))
+    
+    for i, (scenario, table_state, ai_result) in enumerate(zip(scenarios, table_states, ai_results), 1):
+        # Output di ogni scenario accumulato e scritto in blocco
+        # (una write per le fasi 1-3, una per l'overlay)
+        out = [
+            "=" * 70,
+            f"TEST {i}/3: {scenario['name']}",
+            "=" * 70,
+        ]
         
-        # 3. CERVELLO: AI Analysis
-        print("\n🧠 FASE 3: CERVELLO (AI Brain - Groq)")
-        print("   Chiamata /api/poker/live/analyze...")
+        # 1. OCCHI: Screenshot → Riconoscimento (simulato)
+        out += [
+            "\n👁️  FASE 1: OCCHI (Screenshot Recognition)",
+            f"   Hero riconosciute:  {scenario['hero']}",
+            f"   Board riconosciute: {scenario['board']}",
+        ]
+        
+        # 2. Build stato tavolo per AI
+        out.append("\n📊 FASE 2: Costruzione Stato Tavolo")
+        out += [
+            f"   Street: {table_state['street']}",
+            f"   Pot: ${table_state['pot_size']:.2f}",
+            f"   To call: ${table_state['to_call']:.2f}",
+        ]
         
-        ai_result = analyze_table_with_ai(table_state)
+        # 3. CERVELLO: AI Analysis
+        out += [
+            "\n🧠 FASE 3: CERVELLO (AI Brain - Groq)",
+            "   Chiamata /api/poker/live/analyze...",
+        ]
+        _write_lines(out)
         
         if not ai_result:
             print("   ❌ Errore nell'analisi AI")
             continue
         
-        print("   ✅ Analisi ricevuta!")
-        
-        # 4. BOCCA: Overlay Display
-        print("\n👄 FASE 4: BOCCA (Overlay Desktop)")
-        print("   ┌─────────────────────────────────────────┐")
-        print(f"   │  🎴 TAVOLO 1                     ●      │")
-        print("   ├─────────────────────────────────────────┤")
-        print(f"   │  Carte: {' '.join(scenario['hero'])} vs {' '.join(scenario['board']) or 'board vuoto':<15} │")
-        print("   │                                         │")
-        
         action = ai_result['recommended_action']
         amount = ai_result['recommended_amount']
         if action == 'RAISE':
@@ -108,34 +141,26 @@ def test_integration_with_mock_cards():
         else:
             action_display = action
         
-        print(f"   │        {action_display:^31}         │")
-        print("   │                                         │")
-        print(f"   │  Equity: {ai_result['equity_estimate']*100:5.1f}%      Conf: {ai_result['confidence']*100:5.1f}%  │")
-        print("   ├─────────────────────────────────────────┤")
-        
-        # Commento troncato
-        comment = ai_result['ai_comment']
-        if len(comment) > 80:
-            comment = comment[:77] + "..."
-        
-        # Split in righe per visualizzazione
-        words = comment.split()
-        lines = []
-        current_line = "   │  💬 "
-        for word in words:
-            if len(current_line) + len(word) + 1 <= 45:
-                current_line += word + " "
-            else:
-                lines.append(current_line.ljust(43) + "│")
-                current_line = "   │     " + word + " "
-        if current_line.strip() != "   │":
-            lines.append(current_line.ljust(43) + "│")
-        
-        for line in lines[:3]:  # Max 3 righe
-            print(line)
-        
-        print("   └─────────────────────────────────────────┘")
-        print()
+        # 4. BOCCA: Overlay Display
+        out = [
+            "   ✅ Analisi ricevuta!",
+            "\n👄 FASE 4: BOCCA (Overlay Desktop)",
+            "   ┌─────────────────────────────────────────┐",
+            f"   │  🎴 TAVOLO 1                     ●      │",
+            "   ├─────────────────────────────────────────┤",
+            f"   │  Carte: {' '.join(scenario['hero'])} vs {' '.join(scenario['board']) or 'board vuoto':<15} │",
+            "   │                                         │",
+            f"   │        {action_display:^31}         │",
+            "   │                                         │",
+            f"   │  Equity: {ai_result['equity_estimate']*100:5.1f}%      Conf: {ai_result['confidence']*100:5.1f}%  │",
+            "   ├─────────────────────────────────────────┤",
+        ]
+        out += _comment_box_lines(ai_result['ai_comment'])
+        out += [
+            "   └─────────────────────────────────────────┘",
+            "",
+        ]
+        _write_lines(out)
     
     print("=" * 70)
     print("✅ INTEGRAZIONE COMPLETA TESTATA!")
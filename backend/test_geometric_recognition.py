@@ -8,18 +8,29 @@ Test completo del nuovo sistema:
 2. Recognition rank+suit → riconosce carte estratte
 
 Usa screenshot ufficiali PokerStars con carte note.
+Con DEBUG_CARDS=1 salva anche visualizzazione e carte estratte in /tmp.
 """
 
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 from pathlib import Path
 import logging
 
 from board_detector_geometric import detect_board_cards_geometric, visualize_board_detection
-from card_recognition_ranksuit import recognize_card_ranksuit, load_rank_templates, load_suit_templates
+from card_recognition_ranksuit import (
+    recognize_cards_ranksuit, load_rank_templates, load_suit_templates, stack_ranksuit_templates
+)
 
-logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+LOG_FORMAT = '%(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Visualizzazione + PNG delle carte estratte solo se richiesti (DEBUG_CARDS=1)
+SAVE_DEBUG_IMAGES = os.getenv("DEBUG_CARDS") == "1"
+
 # Carte attese per ogni screenshot ufficiale
 EXPECTED_CARDS = {
     "pokerstars_flop.png": {
@@ -41,9 +52,15 @@ EXPECTED_CARDS = {
 }
 
 
-def test_screenshot(screenshot_path: Path, phase: str, expected_cards: list = None):
+def test_screenshot(screenshot_path: Path, phase: str, expected_cards: list = None,
+                    rank_templates: dict = None, suit_templates: dict = None,
+                    template_stacks: tuple = None):
     """
     Test completo su uno screenshot.
+    
+    rank_templates/suit_templates: template già caricati (main() li carica
+    una sola volta per tutti gli screenshot); se None vengono caricati qui.
+    template_stacks: stack_ranksuit_templates() dei template passati (opzionale).
     """
     logger.info(f"\n{'='*80}")
     logger.info(f"📸 TEST: {screenshot_path.name}")
@@ -61,43 +78,41 @@ def test_screenshot(screenshot_path: Path, phase: str, expected_cards: list = No
     cards = detect_board_cards_geometric(screenshot, phase)
     logger.info(f"✅ Cards extracted: {len(cards)}")
     
-    # Salva visualizzazione
-    vis_output = f"/tmp/vis_{screenshot_path.stem}.png"
-    visualize_board_detection(screenshot, phase, vis_output)
-    
-    # Salva carte estratte
-    cards_dir = Path(f"/tmp/cards_{screenshot_path.stem}")
-    cards_dir.mkdir(exist_ok=True)
-    
-    for i, card in enumerate(cards):
-        card.save(cards_dir / f"card_{i+1}.png")
-    
-    logger.info(f"💾 Cards saved in: {cards_dir}")
+    if SAVE_DEBUG_IMAGES:
+        # Salva visualizzazione
+        vis_output = f"/tmp/vis_{screenshot_path.stem}.png"
+        visualize_board_detection(screenshot, phase, vis_output)
+        
+        # Salva carte estratte
+        cards_dir = Path(f"/tmp/cards_{screenshot_path.stem}")
+        cards_dir.mkdir(exist_ok=True)
+        
+        for i, card in enumerate(cards):
+            card.save(cards_dir / f"card_{i+1}.png")
+        
+        logger.info(f"💾 Cards saved in: {cards_dir}")
     
     # FASE 2: RANK+SUIT RECOGNITION
     logger.info(f"\n{'─'*80}")
     logger.info(f"🔍 FASE 2: RANK+SUIT RECOGNITION")
     logger.info(f"{'─'*80}")
     
-    # Load templates
-    rank_templates = load_rank_templates()
-    suit_templates = load_suit_templates()
+    # Load templates (solo se non passati dal chiamante)
+    if rank_templates is None:
+        rank_templates = load_rank_templates()
+    if suit_templates is None:
+        suit_templates = load_suit_templates()
     logger.info(f"Templates loaded: {len(rank_templates)} ranks, {len(suit_templates)} suits")
     
-    # Recognize each card
-    recognized_cards = []
-    for i, card_img in enumerate(cards):
+    # Recognize all cards in one batch (one template comparison for all cards)
+    recognized_cards = recognize_cards_ranksuit(cards, rank_templates, suit_templates, template_stacks)
+    for i, (card_str, confidence) in enumerate(recognized_cards):
         logger.info(f"\n🃏 Card {i+1}/{len(cards)}:")
         
-        result = recognize_card_ranksuit(card_img, rank_templates, suit_templates)
-        
-        if result:
-            card_str, confidence = result
+        if card_str:
             logger.info(f"   ✅ RECOGNIZED: {card_str} ({confidence:.1%})")
-            recognized_cards.append((card_str, confidence))
         else:
             logger.info(f"   ❌ NOT RECOGNIZED")
-            recognized_cards.append((None, 0.0))
     
     # SUMMARY
     logger.info(f"\n{'='*80}")
@@ -123,6 +138,42 @@ def test_screenshot(screenshot_path: Path, phase: str, expected_cards: list = No
     return recognized_cards
 
 
+# Template per processo worker (caricati e impilati al primo screenshot del worker)
+_WORKER_TEMPLATES = None
+
+
+def _process_one(job):
+    """
+    Worker: test completo di uno screenshot in un processo separato.
+    
+    Il log del worker viene catturato e ritornato, così il parent lo
+    riemette nell'ordine degli screenshot invece di mescolare i worker.
+    
+    Returns:
+        (screenshot_name, recognized_cards, log)
+    """
+    global _WORKER_TEMPLATES
+    screenshot_name, screenshot_path, phase, expected = job
+    
+    # Stesso formato dell'handler già configurato (output identico al seriale)
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    log = io.StringIO()
+    handler = logging.StreamHandler(log)
+    handler.setFormatter(saved_handlers[0].formatter if saved_handlers else logging.Formatter(LOG_FORMAT))
+    root.handlers = [handler]
+    try:
+        if _WORKER_TEMPLATES is None:
+            rank_templates, suit_templates = load_rank_templates(), load_suit_templates()
+            _WORKER_TEMPLATES = (rank_templates, suit_templates,
+                                 stack_ranksuit_templates(rank_templates, suit_templates))
+        results = test_screenshot(Path(screenshot_path), phase, expected, *_WORKER_TEMPLATES)
+    finally:
+        root.handlers = saved_handlers
+    
+    return screenshot_name, results, log.getvalue()
+
+
 def main():
     """
     Test tutti gli screenshot ufficiali.
@@ -135,6 +186,8 @@ def main():
     
     all_results = {}
     
+    # Job = solo nome file + fase + carte attese (niente immagini da serializzare)
+    jobs = []
     for screenshot_name, test_config in EXPECTED_CARDS.items():
         screenshot_path = screenshots_dir / screenshot_name
         
@@ -142,11 +195,15 @@ def main():
             logger.warning(f"⚠️ Screenshot not found: {screenshot_path}")
             continue
         
-        phase = test_config["phase"]
-        expected = test_config["board"]
-        
-        results = test_screenshot(screenshot_path, phase, expected)
-        all_results[screenshot_name] = results
+        jobs.append((screenshot_name, str(screenshot_path), test_config["phase"], test_config["board"]))
+    
+    # Screenshot indipendenti: detection + recognition in parallelo,
+    # template caricati una volta per worker
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            for screenshot_name, results, log in executor.map(_process_one, jobs):
+                sys.stderr.write(log)
+                all_results[screenshot_name] = results
     
     # FINAL SUMMARY
     logger.info(f"\n{'#'*80}")
@@ -2,6 +2,7 @@
 """
 Test script per verificare l'integrazione Groq AI nel poker bot
 """
+import asyncio
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -31,91 +32,83 @@ def test_groq_connection():
         return None
 
 
-def test_preflop_analysis(advisor):
-    """Test 2: Analisi preflop con AA"""
-    print("\n" + "=" * 60)
-    print("TEST 2: Analisi Preflop - Pocket Aces")
-    print("=" * 60)
-    
-    analysis = advisor.analyze_hand(
-        hero_cards=["As", "Ah"],
-        board_cards=[],
-        pot_size=3.0,
-        to_call=2.0,
-        hero_stack=100.0,
-        big_blind=1.0,
-        players_in_hand=3,
-        phase="PREFLOP",
-        equity=85.0,
-        suggested_action="RAISE",
-        raise_amount=6.0
-    )
-    
-    print("\n🎴 Situazione:")
-    print("   Hero: As Ah")
-    print("   Board: (vuoto)")
-    print("   Equity: 85%")
-    print("   Azione: RAISE $6.00")
-    print("\n🤖 Analisi AI:")
-    print(f"   {analysis}\n")
+# Test 2-4: situazioni indipendenti (titolo, parametri analyze_hand, righe situazione)
+ANALYSIS_CASES = [
+    (
+        "TEST 2: Analisi Preflop - Pocket Aces",
+        dict(
+            hero_cards=["As", "Ah"],
+            board_cards=[],
+            pot_size=3.0,
+            to_call=2.0,
+            hero_stack=100.0,
+            big_blind=1.0,
+            players_in_hand=3,
+            phase="PREFLOP",
+            equity=85.0,
+            suggested_action="RAISE",
+            raise_amount=6.0
+        ),
+        ["Hero: As Ah", "Board: (vuoto)", "Equity: 85%", "Azione: RAISE $6.00"],
+    ),
+    (
+        "TEST 3: Analisi Flop - Flush Draw",
+        dict(
+            hero_cards=["9h", "8h"],
+            board_cards=["7h", "5h", "2c"],
+            pot_size=20.0,
+            to_call=5.0,
+            hero_stack=87.0,
+            big_blind=1.0,
+            players_in_hand=2,
+            phase="FLOP",
+            equity=55.0,
+            suggested_action="CALL",
+            raise_amount=0.0
+        ),
+        ["Hero: 9h 8h", "Board: 7h 5h 2c", "Equity: 55%", "Azione: CALL"],
+    ),
+    (
+        "TEST 4: Analisi River - Mano Debole",
+        dict(
+            hero_cards=["2h", "7c"],
+            board_cards=["Ac", "Kd", "Qh", "Js", "5s"],
+            pot_size=60.0,
+            to_call=25.0,
+            hero_stack=72.0,
+            big_blind=1.0,
+            players_in_hand=2,
+            phase="RIVER",
+            equity=15.0,
+            suggested_action="FOLD",
+            raise_amount=0.0
+        ),
+        ["Hero: 2h 7c", "Board: Ac Kd Qh Js 5s", "Equity: 15%", "Azione: FOLD"],
+    ),
+]
 
 
-def test_flop_analysis(advisor):
-    """Test 3: Analisi flop con flush draw"""
-    print("\n" + "=" * 60)
-    print("TEST 3: Analisi Flop - Flush Draw")
-    print("=" * 60)
-    
-    analysis = advisor.analyze_hand(
-        hero_cards=["9h", "8h"],
-        board_cards=["7h", "5h", "2c"],
-        pot_size=20.0,
-        to_call=5.0,
-        hero_stack=87.0,
-        big_blind=1.0,
-        players_in_hand=2,
-        phase="FLOP",
-        equity=55.0,
-        suggested_action="CALL",
-        raise_amount=0.0
-    )
-    
-    print("\n🎴 Situazione:")
-    print("   Hero: 9h 8h")
-    print("   Board: 7h 5h 2c")
-    print("   Equity: 55%")
-    print("   Azione: CALL")
-    print("\n🤖 Analisi AI:")
-    print(f"   {analysis}\n")
-
-
-def test_river_fold(advisor):
-    """Test 4: Analisi river - situazione di fold"""
-    print("\n" + "=" * 60)
-    print("TEST 4: Analisi River - Mano Debole")
-    print("=" * 60)
+async def run_analyses(advisor):
+    """
+    Test 2-4: le chiamate Groq partono tutte insieme (asyncio.gather).
     
-    analysis = advisor.analyze_hand(
-        hero_cards=["2h", "7c"],
-        board_cards=["Ac", "Kd", "Qh", "Js", "5s"],
-        pot_size=60.0,
-        to_call=25.0,
-        hero_stack=72.0,
-        big_blind=1.0,
-        players_in_hand=2,
-        phase="RIVER",
-        equity=15.0,
-        suggested_action="FOLD",
-        raise_amount=0.0
-    )
+    Il collo di bottiglia è il round-trip HTTPS, quindi il tempo totale è
+    ~quello della chiamata più lenta. I risultati vengono stampati in ordine.
+    """
+    analyses = await asyncio.gather(*(
+        advisor.analyze_hand_async(**params) for _, params, _ in ANALYSIS_CASES
+    ))
     
-    print("\n🎴 Situazione:")
-    print("   Hero: 2h 7c")
-    print("   Board: Ac Kd Qh Js 5s")
-    print("   Equity: 15%")
-    print("   Azione: FOLD")
-    print("\n🤖 Analisi AI:")
-    print(f"   {analysis}\n")
+    for (title, _, situation), analysis in zip(ANALYSIS_CASES, analyses):
+        print("\n" + "=" * 60)
+        print(title)
+        print("=" * 60)
+        
+        print("\n🎴 Situazione:")
+        for line in situation:
+            print(f"   {line}")
+        print("\n🤖 Analisi AI:")
+        print(f"   {analysis}\n")
 
 
 def main():
@@ -128,10 +121,8 @@ def main():
         print("\n❌ Test falliti: impossibile connettersi a Groq")
         return
     
-    # Test 2-4: Analisi varie situazioni
-    test_preflop_analysis(advisor)
-    test_flop_analysis(advisor)
-    test_river_fold(advisor)
+    # Test 2-4: Analisi varie situazioni (in parallelo)
+    asyncio.run(run_analyses(advisor))
     
     print("=" * 60)
     print("✅ TUTTI I TEST COMPLETATI CON SUCCESSO!")
@@ -7,55 +7,107 @@ Screenshot → Stato JSON → AI Brain → Overlay
 
 Testa diversi scenari poker per verificare che l'AI risponda correttamente.
 """
+import io
 import requests
-import json
-from typing import Dict, Any
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Optional, TextIO
+from requests.adapters import HTTPAdapter
 
 
 API_URL = "https://table-analyzer.preview.emergentagent.com/api/poker/live/analyze"
 
 
-def test_scenario(name: str, table_state: Dict[str, Any]) -> None:
-    """Testa un singolo scenario."""
-    print("\n" + "=" * 70)
-    print(f"📊 SCENARIO: {name}")
-    print("=" * 70)
+def _pretty_json(obj: Any) -> str:
+    """JSON indentato a 2 spazi (orjson: UTF-8, stesso layout di json.dumps)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def test_scenario(name: str, table_state: Dict[str, Any],
+                  session: Optional[requests.Session] = None,
+                  out: Optional[TextIO] = None) -> bool:
+    """
+    Testa un singolo scenario.
+    
+    Args:
+        name: Nome dello scenario
+        table_state: Stato tavolo inviato all'API
+        session: Sessione HTTP condivisa (keep-alive); default requests.post
+        out: Dove scrivere il report (default stdout)
+    """
+    say = partial(print, file=out)
+    
+    say("\n" + "=" * 70)
+    say(f"📊 SCENARIO: {name}")
+    say("=" * 70)
     
-    print("\n📥 INPUT - Stato Tavolo:")
-    print(json.dumps(table_state, indent=2, ensure_ascii=False))
+    say("\n📥 INPUT - Stato Tavolo:")
+    say(_pretty_json(table_state))
     
     try:
         # Chiamata API
-        response = requests.post(API_URL, json=table_state, timeout=15)
+        response = (session or requests).post(API_URL, json=table_state, timeout=15)
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
-        print("\n📤 OUTPUT - Analisi AI:")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        say("\n📤 OUTPUT - Analisi AI:")
+        say(_pretty_json(result))
         
-        print("\n" + "-" * 70)
-        print(f"🎯 Azione:      {result['recommended_action']}", end="")
+        say("\n" + "-" * 70)
+        say(f"🎯 Azione:      {result['recommended_action']}", end="")
         if result['recommended_action'] == 'RAISE':
-            print(f" ${result['recommended_amount']:.2f}")
+            say(f" ${result['recommended_amount']:.2f}")
         else:
-            print()
-        print(f"📈 Equity:      {result['equity_estimate']*100:.1f}%")
-        print(f"🎚️  Confidenza:  {result['confidence']*100:.1f}%")
-        print(f"\n💬 Commento AI:")
-        print(f"   {result['ai_comment']}")
-        print("-" * 70)
+            say()
+        say(f"📈 Equity:      {result['equity_estimate']*100:.1f}%")
+        say(f"🎚️  Confidenza:  {result['confidence']*100:.1f}%")
+        say(f"\n💬 Commento AI:")
+        say(f"   {result['ai_comment']}")
+        say("-" * 70)
         
         return True
         
-    except requests.exceptions.RequestException as e:
-        print(f"\n❌ ERRORE nella chiamata API: {e}")
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        say(f"\n❌ ERRORE nella chiamata API: {e}")
         return False
     except Exception as e:
-        print(f"\n❌ ERRORE inaspettato: {e}")
+        say(f"\n❌ ERRORE inaspettato: {e}")
         return False
 
 
+def run_scenarios(scenarios):
+    """
+    Esegue gli scenari in parallelo e stampa i report nell'ordine originale.
+    
+    Le chiamate sono puro I/O di rete (round-trip verso l'AI): con un thread
+    per scenario il tempo totale è ~la latenza della chiamata più lenta invece
+    della somma. Una sola Session con pool di connessioni keep-alive.
+    
+    Returns:
+        Lista di (nome, successo)
+    """
+    def run(scenario):
+        out = io.StringIO()
+        success = test_scenario(scenario["name"], scenario["state"], session, out)
+        return success, out.getvalue()
+    
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(scenarios))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+            outcomes = list(executor.map(run, scenarios))
+    
+    results = []
+    for scenario, (success, report) in zip(scenarios, outcomes):
+        print(report, end="")
+        results.append((scenario["name"], success))
+    return results
+
+
 def main():
     """Esegue tutti i test."""
     print("\n" + "╔" + "═" * 68 + "╗")
@@ -190,10 +242,7 @@ def main():
         }
     ]
     
-    results = []
-    for scenario in scenarios:
-        success = test_scenario(scenario["name"], scenario["state"])
-        results.append((scenario["name"], success))
+    results = run_scenarios(scenarios)
     
     # Summary
     print("\n\n" + "╔" + "═" * 68 + "╗")
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 # Import moduli del bot
 from card_detector_simple import cut_board_cards_slot_based
-from card_recognition_ranksuit import recognize_card_ranksuit, load_rank_templates, load_suit_templates
+from card_recognition_ranksuit import recognize_cards_ranksuit, load_rank_templates, load_suit_templates
 
 def test_screenshot_recognition(screenshot_path: str):
     """
@@ -95,14 +95,14 @@ def test_screenshot_recognition(screenshot_path: str):
         card_img.save(debug_dir / f"card_{i+1}.png")
     logger.info(f"💾 Carte estratte salvate in: {debug_dir}/\n")
     
+    # Tutte le carte (board + hero) riconosciute in un solo batch
+    results = recognize_cards_ranksuit(cards, rank_templates, suit_templates)
+    
     recognized_cards = []
-    for i, card_img in enumerate(cards):
+    for i, (card_str, confidence) in enumerate(results):
         logger.info(f"\n🃏 Carta {i+1}/{len(cards)}:")
         
-        result = recognize_card_ranksuit(card_img, rank_templates, suit_templates)
-        
-        if result:
-            card_str, confidence = result
+        if card_str:
             logger.info(f"   ✅ RICONOSCIUTA: {card_str} (confidence: {confidence:.1%})")
             recognized_cards.append((card_str, confidence))
         else:
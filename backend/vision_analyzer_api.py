@@ -1,11 +1,14 @@
 """
 VISION ANALYZER API - Endpoint dedicato per analisi screenshot manuale
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO
+from concurrent.futures import Executor
+import asyncio
 import logging
-from equity_calculator import EquityCalculator
+import shutil
+from equity_calculator import compute_equity_percentage
 from poker_config import (
     MARGIN,
     STRONG_EQUITY_THRESHOLD,
@@ -21,23 +24,53 @@ from shared_state import SharedState # Import memoria condivisa
 from poker_vision_ai import PokerVisionAI
 
 
-def _compute_math_equity_and_decision(vision_result: Dict[str, Any]) -> Dict[str, Any]:
-    """Calcola equity matematica (HU) + decisione FOLD/CALL/RAISE.
+def _save_upload(src: BinaryIO, dest: Path) -> int:
+    """Copia l'upload su disco a blocchi da 1 MB e riavvolge src per la decodifica.
 
-    Usa EquityCalculator (Monte Carlo) e le costanti di poker_config.
-    Ignora completamente equity/azione proposte da Gemini.
+    Il file intero non viene mai caricato come bytes nell'heap Python.
+    Ritorna la dimensione in bytes.
+    """
+    src.seek(0)
+    with open(dest, "wb") as out:
+        shutil.copyfileobj(src, out, 1 << 20)
+        size = out.tell()
+    src.seek(0)
+    return size
+
+
+async def _compute_math_equity_async(mc_pool: Executor, vision_result: Dict[str, Any]) -> float:
+    """Esegue il Monte Carlo HU (num_opponents=1) su mc_pool senza bloccare l'event loop.
+
+    Il Monte Carlo è CPU-bound: mc_pool è il pool di processi creato nel
+    lifespan di server.py (app.state.mc_pool).
     """
     hero_cards = vision_result.get("hero_cards") or []
     board_cards = vision_result.get("board_cards") or []
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        mc_pool, compute_equity_percentage, hero_cards, board_cards, 1
+    )
+
+
+def _compute_math_equity_and_decision(vision_result: Dict[str, Any], equity_math: float) -> Dict[str, Any]:
+    """Calcola la decisione FOLD/CALL/RAISE a partire dall'equity matematica (HU).
+
+    L'equity arriva da EquityCalculator (Monte Carlo, vedi _compute_math_equity_async);
+    la decisione usa le costanti di poker_config.
+    Ignora completamente equity/azione proposte da Gemini.
+
+    Il dict vision_result appartiene alla singola richiesta: viene aggiornato
+    in place con i campi decisionali e ritornato, senza copiarlo.
+    """
+    # Equity proposta da Gemini, letta prima di sovrascriverla (solo per log)
+    equity_gemini = vision_result.get("equity_estimate")
+
     hero_stack = float(vision_result.get("hero_stack") or 0.0)
     pot_size = float(vision_result.get("pot_size") or 0.0)
     to_call = float(vision_result.get("to_call") or 0.0)
     street: str = (vision_result.get("street") or "").upper() or "UNKNOWN"
 
-    # Calcolo equity HU (num_opponents=1)
-    equity_calc = EquityCalculator()
-    equity_math = equity_calc.get_equity_percentage(hero_cards, board_cards, num_opponents=1)
-
     # Pot odds di base (se c'è da chiamare)
     pot_odds = None
     if to_call > 0 and (pot_size + to_call) > 0:
@@ -70,12 +103,6 @@ def _compute_math_equity_and_decision(vision_result: Dict[str, Any]) -> Dict[str
             action = "CALL"
             amount = to_call
 
-    # Costruiamo risultato finale sovrascrivendo sempre i campi decisionali
-    result = dict(vision_result)  # copy
-    result["equity_estimate"] = float(equity_math)
-    result["recommended_action"] = action
-    result["recommended_amount"] = float(amount)
-
     # Confidence derivata da quanto equity supera pot_odds (se definite)
     confidence = 0.5
     try:
@@ -90,10 +117,15 @@ def _compute_math_equity_and_decision(vision_result: Dict[str, Any]) -> Dict[str
     except Exception:
         confidence = 0.5
 
-    result["confidence"] = float(confidence)
+    # Risultato finale: sovrascriviamo sempre i campi decisionali
+    vision_result.update(
+        equity_estimate=float(equity_math),
+        recommended_action=action,
+        recommended_amount=float(amount),
+        confidence=float(confidence),
+    )
 
     # Log per confronto debugging: equity gemini vs matematica
-    equity_gemini = vision_result.get("equity_estimate")
     logger.info(
         "🎯 Equity math=%.3f, equity_gemini=%s, action=%s, amount=%.2f, pot=%.2f, to_call=%.2f",
         equity_math,
@@ -104,7 +136,7 @@ def _compute_math_equity_and_decision(vision_result: Dict[str, Any]) -> Dict[str
         to_call,
     )
 
-    return result
+    return vision_result
 
 
 
@@ -119,7 +151,7 @@ TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @vision_router.post("/analyze")
-async def analyze_screenshot(file: UploadFile = File(...)) -> Dict[str, Any]:
+async def analyze_screenshot(request: Request, file: UploadFile = File(...)) -> Dict[str, Any]:
     """
     Analizza uno screenshot di un tavolo poker con Gemini Vision AI.
     """
@@ -131,24 +163,25 @@ async def analyze_screenshot(file: UploadFile = File(...)) -> Dict[str, Any]:
                 detail="File deve essere un'immagine (PNG, JPG, JPEG)"
             )
         
-        # Salva temporaneamente
+        # Salva temporaneamente (copia a blocchi, fuori dall'event loop)
         temp_path = TEMP_DIR / f"upload_{file.filename}"
         
-        contents = await file.read()
-        with open(temp_path, "wb") as f:
-            f.write(contents)
+        size = await asyncio.to_thread(_save_upload, file.file, temp_path)
         
-        logger.info(f"📸 Screenshot ricevuto: {file.filename} ({len(contents)} bytes)")
+        logger.info(f"📸 Screenshot ricevuto: {file.filename} ({size} bytes)")
         
         # Inizializza Vision AI
         vision_ai = PokerVisionAI()
         
         # Analisi Vision (lettura tavolo)
         logger.info("🧠 Analisi con Gemini Vision (lettura stato tavolo)...")
-        vision_result = await vision_ai.analyze_poker_table(str(temp_path), table_id=999)
+        vision_result = await vision_ai.analyze_poker_table(
+            str(temp_path), table_id=999, image_file=file.file
+        )
 
-        # Calcolo equity matematica + decisione HU (Fase 1)
-        math_result = _compute_math_equity_and_decision(vision_result)
+        # Calcolo equity matematica (fuori dall'event loop) + decisione HU (Fase 1)
+        equity_math = await _compute_math_equity_async(request.app.state.mc_pool, vision_result)
+        math_result = _compute_math_equity_and_decision(vision_result, equity_math)
 
         # --- AGGIORNAMENTO MEMORIA PER OVERLAY ---
         SharedState.update(math_result)
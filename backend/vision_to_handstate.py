@@ -8,23 +8,23 @@ Collega tutti i moduli Fase 3 (regioni) + Fase 4 (riconoscimento) → oggetto Ha
 Ordini del Capo - Fase 4: Screenshot → HandState per EquityEngine & DecisionEngine.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 import logging
+import numpy as np
 from PIL import Image
 
 # Import Phase 3 modules (table processing)
 from table_layout import load_room_config, RoomConfig
 from table_capture_static import load_table_image
-from table_region_cutter import (
-    cut_hero_cards, cut_board_cards, 
-    cut_pot_region, cut_hero_stack_region
-)
+from table_region_cutter import cut_all_regions
 
 # Import Phase 4 modules (recognition)  
 from card_templates import load_card_templates
-from card_recognition import recognize_cards, filter_recognized_cards
+from card_recognition import recognize_cards, filter_recognized_cards, stack_card_templates
 from digit_templates import load_digit_templates
 from number_recognition import recognize_number
 
@@ -41,6 +41,28 @@ DEFAULT_CARD_TEMPLATES_DIR = "card_templates/normalized"
 DEFAULT_DIGIT_TEMPLATES_DIR = "digit_templates/normalized"
 
 
+def _cached_templates(loader, template_dir: str) -> Dict:
+    """
+    Load a template directory once per process and share it across engines.
+    
+    Keyed on the absolute path and the directory mtime, so adding, removing
+    or renaming template files triggers a reload. Templates are read-only
+    for the engine, so sharing the dict is safe.
+    """
+    path = os.path.abspath(template_dir)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = -1  # the loader logs the missing directory and returns {}
+    return _load_templates_cached(loader, path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_templates_cached(loader, path: str, mtime_ns: int) -> Dict:
+    """Actual template decode (mtime_ns only serves as cache key)."""
+    return loader(path)
+
+
 class VisionPokerEngine:
     """
     Main engine for converting poker screenshots to HandState objects.
@@ -65,6 +87,7 @@ class VisionPokerEngine:
         # Load configurations and templates
         self.room_config = None
         self.card_templates = {}
+        self.card_template_stack = None
         self.digit_templates = {}
         
         self._load_configurations()
@@ -79,12 +102,13 @@ class VisionPokerEngine:
             else:
                 logger.error(f"Room config not found: {self.config_path}")
             
-            # Load card templates
-            self.card_templates = load_card_templates(self.card_templates_dir)
+            # Load card templates (decoded once per process, see _cached_templates)
+            self.card_templates = _cached_templates(load_card_templates, self.card_templates_dir)
+            self.card_template_stack = stack_card_templates(self.card_templates)
             logger.info(f"Loaded {len(self.card_templates)} card templates")
             
             # Load digit templates
-            self.digit_templates = load_digit_templates(self.digit_templates_dir)
+            self.digit_templates = _cached_templates(load_digit_templates, self.digit_templates_dir)
             logger.info(f"Loaded {len(self.digit_templates)} digit templates")
             
         except Exception as e:
@@ -107,12 +131,14 @@ class VisionPokerEngine:
             # Load and crop table image
             table_image = load_table_image(screenshot_path, self.room_config)
             
-            # Extract all regions
-            regions = {}
-            regions['hero_cards'] = cut_hero_cards(table_image, self.room_config)
-            regions['board_cards'] = cut_board_cards(table_image, self.room_config)
-            regions['pot_region'] = cut_pot_region(table_image, self.room_config)
-            regions['hero_stack_region'] = cut_hero_stack_region(table_image, self.room_config)
+            # Extract all regions in one pass, then wrap as PIL for the recognizers
+            views = cut_all_regions(np.asarray(table_image), self.room_config)
+            regions = {
+                'hero_cards': [Image.fromarray(card) for card in views['hero_cards']],
+                'board_cards': [Image.fromarray(card) for card in views['board_cards']],
+                'pot_region': Image.fromarray(views['pot_region']),
+                'hero_stack_region': Image.fromarray(views['hero_stack_region']),
+            }
             
             logger.info(f"Extracted regions from {Path(screenshot_path).name}")
             return regions
@@ -131,23 +157,45 @@ class VisionPokerEngine:
         Returns:
             List of recognized card codes
         """
+        return self.recognize_card_groups(card_images)[0]
+    
+    def recognize_card_groups(self, *groups: List[Image.Image]) -> List[List[str]]:
+        """
+        Recognize several groups of card regions (e.g. hero and board) in one batch.
+        
+        All regions are matched against the templates in a single call;
+        unrecognized cards and duplicates are then filtered per group.
+        
+        Args:
+            *groups: Lists of PIL Images containing cards
+            
+        Returns:
+            One list of recognized card codes per group
+        """
         if not self.card_templates:
             logger.warning("No card templates loaded")
-            return []
+            return [[] for _ in groups]
         
         try:
             # Recognize all cards
-            recognition_results = recognize_cards(card_images, self.card_templates)
-            
-            # Filter out unrecognized cards
-            recognized_cards = filter_recognized_cards(recognition_results)
+            card_images = [image for group in groups for image in group]
+            recognition_results = recognize_cards(
+                card_images, self.card_templates, self.card_template_stack
+            )
             
-            logger.debug(f"Recognized {len(recognized_cards)}/{len(card_images)} cards")
-            return recognized_cards
+            # Split back per group and filter out unrecognized cards
+            recognized_groups = []
+            start = 0
+            for group in groups:
+                recognized_cards = filter_recognized_cards(recognition_results[start:start + len(group)])
+                logger.debug(f"Recognized {len(recognized_cards)}/{len(group)} cards")
+                recognized_groups.append(recognized_cards)
+                start += len(group)
+            return recognized_groups
             
         except Exception as e:
             logger.error(f"Error recognizing cards: {e}")
-            return []
+            return [[] for _ in groups]
     
     def recognize_number_from_region(self, number_image: Image.Image) -> Optional[float]:
         """
@@ -203,15 +251,11 @@ class VisionPokerEngine:
                 logger.error("Failed to extract regions from screenshot")
                 return None
             
-            # Step 2: Recognize hero cards
-            hero_cards_recognized = []
-            if 'hero_cards' in regions and regions['hero_cards']:
-                hero_cards_recognized = self.recognize_cards_from_regions(regions['hero_cards'])
-            
-            # Step 3: Recognize board cards
-            board_cards_recognized = []
-            if 'board_cards' in regions and regions['board_cards']:
-                board_cards_recognized = self.recognize_cards_from_regions(regions['board_cards'])
+            # Steps 2-3: Recognize hero + board cards in one batch
+            hero_cards_recognized, board_cards_recognized = self.recognize_card_groups(
+                regions.get('hero_cards') or [],
+                regions.get('board_cards') or []
+            )
             
             # Step 4: Recognize pot amount
             pot_size = None